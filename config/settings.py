@@ -29,6 +29,7 @@ class Settings:
             ],
             "backup_enabled": True,
             "backup_path": os.path.join(os.path.expanduser("~"), ".ultra_turbo_cleaner", "backups"),
+            "backup_compression": "deflate",  # or "zstd" (needs the zstandard package)
             "safe_mode": True,
             "max_file_age_days": 30,
             "min_file_size_mb": 1,
@@ -5,14 +5,21 @@ import os
 import hashlib
 import mimetypes
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from enum import Enum
 import json
 import logging
 from datetime import datetime, timedelta
 
+from core.scanner import ScanBatch
+
 logger = logging.getLogger(__name__)
 
+# Classification constants, built once instead of on every analyze_file() call
+_CRITICAL_PATHS = ("windows/system32", "windows/syswow64", "program files")
+_TEMP_EXTENSIONS = frozenset({".tmp", ".temp", ".~"})
+_CACHE_NAMES = frozenset({"thumbs.db", "desktop.ini"})
+
 class FileCategory(Enum):
     SAFE_TO_DELETE = "safe"
     POTENTIALLY_DANGEROUS = "dangerous" 
@@ -34,6 +41,7 @@ class FileAnalyzer:
     def __init__(self, settings):
         self.settings = settings
         self.patterns = self._load_patterns()
+        self.dangerous_extensions = frozenset(self.patterns["dangerous_extensions"])
         
     def _load_patterns(self) -> Dict:
         """Load file categorization patterns"""
@@ -55,69 +63,57 @@ class FileAnalyzer:
     def analyze_file(self, file_path: Path) -> Tuple[FileCategory, FileSafetyLevel]:
         """Analyze file and determine category and safety level"""
         try:
-            extension = file_path.suffix.lower()
-            
-            if self._is_critical_system_file(file_path):
-                return FileCategory.CRITICAL_SYSTEM, FileSafetyLevel.DANGEROUS
-            
-            if self._is_safe_temp_file(file_path):
-                return FileCategory.TEMP, FileSafetyLevel.VERY_SAFE
-                
-            if self._is_cache_file(file_path):
-                return FileCategory.CACHE, FileSafetyLevel.SAFE
-                
-            if self._is_log_file(file_path):
-                return FileCategory.LOG, FileSafetyLevel.SAFE
-            
-            if extension in self.patterns["dangerous_extensions"]:
-                return FileCategory.POTENTIALLY_DANGEROUS, FileSafetyLevel.RISKY
-            
-            return FileCategory.USER_DATA, FileSafetyLevel.MODERATE
-            
+            return self._classify(*self._path_keys(file_path))
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {e}")
             return FileCategory.USER_DATA, FileSafetyLevel.RISKY
     
-    def _is_critical_system_file(self, file_path: Path) -> bool:
+    @staticmethod
+    def _path_keys(file_path: Path) -> Tuple[str, str, str]:
+        """Lowercased full path, file name and extension, computed once per file"""
+        return str(file_path).lower(), file_path.name.lower(), file_path.suffix.lower()
+    
+    def _classify(self, path_str: str, name: str, extension: str) -> Tuple[FileCategory, FileSafetyLevel]:
+        """Classification kernel over precomputed lowercase path keys"""
+        if self._is_critical_system_file(path_str):
+            return FileCategory.CRITICAL_SYSTEM, FileSafetyLevel.DANGEROUS
+        
+        if self._is_safe_temp_file(name, extension):
+            return FileCategory.TEMP, FileSafetyLevel.VERY_SAFE
+            
+        if self._is_cache_file(path_str, name):
+            return FileCategory.CACHE, FileSafetyLevel.SAFE
+            
+        if self._is_log_file(name, extension):
+            return FileCategory.LOG, FileSafetyLevel.SAFE
+        
+        if extension in self.dangerous_extensions:
+            return FileCategory.POTENTIALLY_DANGEROUS, FileSafetyLevel.RISKY
+        
+        return FileCategory.USER_DATA, FileSafetyLevel.MODERATE
+    
+    def _is_critical_system_file(self, path_str: str) -> bool:
         """Check if file is critical for system"""
-        critical_paths = [
-            "windows/system32",
-            "windows/syswow64", 
-            "program files"
-        ]
-        path_str = str(file_path).lower()
-        return any(critical in path_str for critical in critical_paths)
+        return any(critical in path_str for critical in _CRITICAL_PATHS)
     
-    def _is_safe_temp_file(self, file_path: Path) -> bool:
+    def _is_safe_temp_file(self, name: str, extension: str) -> bool:
         """Check if file is temporary and safe"""
-        temp_indicators = [
-            file_path.suffix.lower() in [".tmp", ".temp", ".~"],
-            "temp" in file_path.name.lower(),
-            file_path.name.startswith("~")
-        ]
-        return any(temp_indicators)
+        return extension in _TEMP_EXTENSIONS or "temp" in name or name.startswith("~")
     
-    def _is_cache_file(self, file_path: Path) -> bool:
+    def _is_cache_file(self, path_str: str, name: str) -> bool:
         """Check if file is cache"""
-        cache_indicators = [
-            "cache" in str(file_path).lower(),
-            "thumbnails" in str(file_path).lower(),
-            file_path.name.lower() in ["thumbs.db", "desktop.ini"]
-        ]
-        return any(cache_indicators)
+        return "cache" in path_str or "thumbnails" in path_str or name in _CACHE_NAMES
     
-    def _is_log_file(self, file_path: Path) -> bool:
+    def _is_log_file(self, name: str, extension: str) -> bool:
         """Check if file is log"""
-        return (file_path.suffix.lower() == ".log" or 
-                "log" in file_path.name.lower())
+        return extension == ".log" or "log" in name
     
     async def analyze_files(self, file_paths: List[Dict]) -> List[Dict]:
         """Analyze multiple files"""
         results = []
         for file_info in file_paths:
             try:
-                file_path = Path(file_info["path"])
-                category, safety = self.analyze_file(file_path)
+                category, safety = self._classify(*self._path_keys(Path(file_info["path"])))
                 
                 file_info["category"] = category.value
                 file_info["safety_level"] = safety.value
@@ -131,4 +127,24 @@ class FileAnalyzer:
                 file_info["cleanable"] = False
                 results.append(file_info)
         
-        return results
\ No newline at end of file
+        return results
+    
+    async def analyze_batch(self, batch: ScanBatch, start: int = 0, stop: Optional[int] = None) -> ScanBatch:
+        """Analyze a columnar ScanBatch in place, optionally only rows [start, stop)"""
+        if stop is None:
+            stop = len(batch)
+        paths = batch.paths
+        for i in range(start, stop):
+            path = paths[i]
+            try:
+                category, safety = self._classify(*self._path_keys(Path(path)))
+                batch.categories[i] = category.value
+                batch.safety_levels[i] = safety.value
+                batch.cleanable[i] = safety.value <= 2  # VERY_SAFE or SAFE
+            except Exception as e:
+                logger.error(f"Error analyzing {path}: {e}")
+                batch.categories[i] = "unknown"
+                batch.safety_levels[i] = 5
+                batch.cleanable[i] = False
+        
+        return batch
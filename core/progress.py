@@ -45,6 +45,9 @@ class ProgressInfo:
     
     status_message: str = ""
     last_error: Optional[str] = None
+    
+    # Monotonic start stamp for elapsed_time, immune to wall-clock adjustments
+    start_ns: int = field(default=0, repr=False)
 
 class ProgressTracker:
     def __init__(self):
@@ -52,6 +55,20 @@ class ProgressTracker:
         self.callbacks: Dict[str, list] = {}
         self.lock = threading.Lock()
         
+    def add_callback(self, callback: Callable[[ProgressInfo], None], operation_id: str = "*"):
+        """Register a callback for changes to one operation, or to every operation by default"""
+        with self.lock:
+            self.callbacks.setdefault(operation_id, []).append(callback)
+    
+    def _notify(self, progress: ProgressInfo):
+        """Run the callbacks for progress; called after the lock is released"""
+        for key in ("*", progress.operation_id):
+            for callback in self.callbacks.get(key, ()):
+                try:
+                    callback(progress)
+                except Exception as e:
+                    logger.error(f"Progress callback failed for {progress.operation_id}: {e}")
+    
     def create_operation(self, operation_id: str, operation_name: str, 
                         total_items: int = 0) -> ProgressInfo:
         """Create new operation for tracking"""
@@ -67,14 +84,22 @@ class ProgressTracker:
     def start_operation(self, operation_id: str, total_items: int = 0) -> bool:
         """Start an operation"""
         with self.lock:
-            if operation_id not in self.operations:
-                # Create operation if it doesn't exist
-                self.create_operation(operation_id, operation_id, total_items)
+            progress = self.operations.get(operation_id)
+            if progress is None:
+                # Create operation if it doesn't exist (inline: self.lock is not reentrant)
+                progress = ProgressInfo(
+                    operation_id=operation_id,
+                    operation_name=operation_id,
+                    total=total_items
+                )
+                self.operations[operation_id] = progress
             
-            progress = self.operations[operation_id]
             progress.status = OperationStatus.RUNNING
             progress.start_time = datetime.now()
-            return True
+            progress.start_ns = time.monotonic_ns()
+        
+        self._notify(progress)
+        return True
     
     def update_progress(self, operation_id: str, current: Optional[int] = None,
                        current_item: str = "", status_message: str = "") -> bool:
@@ -96,8 +121,9 @@ class ProgressTracker:
             
             if status_message:
                 progress.status_message = status_message
-            
-            return True
+        
+        self._notify(progress)
+        return True
     
     def complete_operation(self, operation_id: str = None, success: bool = True) -> bool:
         """Mark operation as completed"""
@@ -107,7 +133,7 @@ class ProgressTracker:
             
             # If no operation_id provided, complete the most recent one
             if not operation_id and self.operations:
-                operation_id = list(self.operations.keys())[-1]
+                operation_id = next(reversed(self.operations))
             
             if not operation_id:
                 return False
@@ -116,10 +142,12 @@ class ProgressTracker:
             progress.status = OperationStatus.COMPLETED if success else OperationStatus.FAILED
             progress.end_time = datetime.now()
             
-            if progress.start_time:
-                progress.elapsed_time = progress.end_time - progress.start_time
-            
-            return True
+            if progress.start_ns:
+                elapsed_ns = time.monotonic_ns() - progress.start_ns
+                progress.elapsed_time = timedelta(microseconds=elapsed_ns // 1000)
+        
+        self._notify(progress)
+        return True
     
     def get_progress(self, operation_id: str) -> Optional[ProgressInfo]:
         """Get progress information for operation"""
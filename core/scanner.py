@@ -5,13 +5,102 @@ File and directory scanning functionality
 import logging
 import asyncio
 import os
+from array import array
+from dataclasses import dataclass, field
+from itertools import compress
 from pathlib import Path
-from typing import List, Dict, Any, AsyncGenerator
+from typing import List, Dict, Any, AsyncGenerator, Iterator, Union
 import stat
 import time
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ScanBatch:
+    """Columnar (structure-of-arrays) container for scanned files
+    
+    Numeric columns are packed into ``array.array`` instead of keeping one
+    dict per file, so large scans hold a few machine words per file rather
+    than a full dict. Indexing returns the familiar per-file dict view.
+    """
+    paths: List[str] = field(default_factory=list)
+    extensions: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    mtimes: array = field(default_factory=lambda: array('d'))
+    ages: array = field(default_factory=lambda: array('d'))
+    categories: List[str] = field(default_factory=list)
+    safety_levels: array = field(default_factory=lambda: array('b'))
+    cleanable: array = field(default_factory=lambda: array('b'))
+    
+    @classmethod
+    def from_files(cls, files: List[Dict[str, Any]]) -> "ScanBatch":
+        """Build a batch from a list of per-file dicts, one column at a time"""
+        return cls(
+            paths=[f.get("path", "") for f in files],
+            extensions=[f.get("extension", "") for f in files],
+            sizes=array('q', [int(f.get("size", 0)) for f in files]),
+            mtimes=array('d', [f.get("modified_time", 0.0) for f in files]),
+            ages=array('d', [f.get("age_days", 0.0) for f in files]),
+            categories=[f.get("category", "unknown") for f in files],
+            safety_levels=array('b', [f.get("safety_level", 5) for f in files]),
+            cleanable=array('b', [bool(f.get("cleanable", False)) for f in files])
+        )
+    
+    def append(self, file_info: Dict[str, Any]) -> None:
+        """Append one file described by a per-file dict"""
+        self.paths.append(file_info.get("path", ""))
+        self.extensions.append(file_info.get("extension", ""))
+        self.sizes.append(int(file_info.get("size", 0)))
+        self.mtimes.append(file_info.get("modified_time", 0.0))
+        self.ages.append(file_info.get("age_days", 0.0))
+        self.categories.append(file_info.get("category", "unknown"))
+        self.safety_levels.append(file_info.get("safety_level", 5))
+        self.cleanable.append(bool(file_info.get("cleanable", False)))
+    
+    def extend(self, other: "ScanBatch") -> None:
+        """Append all files of another batch"""
+        self.paths.extend(other.paths)
+        self.extensions.extend(other.extensions)
+        self.sizes.extend(other.sizes)
+        self.mtimes.extend(other.mtimes)
+        self.ages.extend(other.ages)
+        self.categories.extend(other.categories)
+        self.safety_levels.extend(other.safety_levels)
+        self.cleanable.extend(other.cleanable)
+    
+    def cleanable_sizes(self) -> Iterator[int]:
+        """Sizes of the files marked as cleanable"""
+        return compress(self.sizes, self.cleanable)
+    
+    def _row(self, index: int) -> Dict[str, Any]:
+        path = self.paths[index]
+        return {
+            "path": path,
+            "name": os.path.basename(path),
+            "extension": self.extensions[index],
+            "size": self.sizes[index],
+            "modified_time": self.mtimes[index],
+            "age_days": self.ages[index],
+            "category": self.categories[index],
+            "safety_level": self.safety_levels[index],
+            "cleanable": bool(self.cleanable[index])
+        }
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ScanBatch index out of range")
+        return self._row(index)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self._row(i) for i in range(len(self)))
+
 class FileScanner:
     """File system scanner for detecting files to clean"""
     
@@ -49,6 +138,33 @@ class FileScanner:
             logger.error(f"Error scanning {path}: {e}")
             return []
     
+    async def scan_path_batch(self, path: str) -> ScanBatch:
+        """Scan a single path into a columnar ScanBatch"""
+        logger.info(f"Scanning path: {path}")
+        batch = ScanBatch()
+        
+        try:
+            path_obj = Path(path)
+            if not path_obj.exists():
+                logger.warning(f"Path does not exist: {path}")
+                return batch
+            
+            async for file_info in self._scan_directory_async(path_obj):
+                batch.append(file_info)
+                
+                # Yield control periodically for better responsiveness
+                if len(batch) % 1000 == 0:
+                    await asyncio.sleep(0.01)
+            
+            logger.info(f"Found {len(batch)} files in {path}")
+            
+        except PermissionError:
+            logger.warning(f"Permission denied accessing: {path}")
+        except Exception as e:
+            logger.error(f"Error scanning {path}: {e}")
+        
+        return batch
+    
     async def _scan_directory_async(self, directory: Path) -> AsyncGenerator[Dict[str, Any], None]:
         """Asynchronously scan directory and yield file information"""
         try:
@@ -8,9 +8,12 @@ from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 from core.progress import ProgressTracker
+from utils.file_operations import FileOperations
 
 logger = logging.getLogger(__name__)
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 class BrowserCleaner:
     """Specialized cleaner for browser data"""
     
@@ -205,15 +208,27 @@ class BrowserCleaner:
         result = {'files_deleted': 0, 'bytes_freed': 0}
         
         try:
-            for item in directory_path.rglob('*'):
-                if item.is_file():
-                    try:
-                        file_size = item.stat().st_size
-                        item.unlink()
-                        result['files_deleted'] += 1
-                        result['bytes_freed'] += file_size
-                    except Exception as e:
-                        logger.debug(f"Could not delete {item}: {e}")
+            # Walk with scandir and hand each directory's files to the bulk delete as DirEntry objects
+            stack = [os.fspath(directory_path)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        files = []
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                elif entry.is_file():
+                                    files.append(entry)
+                            except OSError:
+                                continue
+                except OSError as e:
+                    logger.debug(f"Could not list {e.filename}: {e}")
+                    continue
+                
+                deleted, bytes_freed = FileOperations.safe_delete_entries(files)
+                result['files_deleted'] += deleted
+                result['bytes_freed'] += bytes_freed
         except Exception as e:
             logger.error(f"Error cleaning directory {directory_path}: {e}")
         
@@ -355,8 +370,9 @@ class BrowserCleaner:
     
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
\ No newline at end of file
+        if bytes_value < 1024:
+            return f"{bytes_value:.1f} B"
+        
+        # Each unit spans 10 bits, so the bit length picks the unit without a division loop
+        unit_index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / (1 << (unit_index * 10)):.1f} {_BYTE_UNITS[unit_index]}"
\ No newline at end of file
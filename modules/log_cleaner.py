@@ -211,10 +211,11 @@ class LogCleaner:
                 if not log_file.exists():
                     continue
                 
-                file_size = log_file.stat().st_size
+                stat_info = log_file.stat()
+                file_size = stat_info.st_size
                 
                 # Try to truncate first (safer for active logs)
-                if self._is_likely_active_log(log_file):
+                if self._is_likely_active_log(log_file, stat_info.st_mtime):
                     try:
                         with open(log_file, 'w') as f:
                             f.truncate(0)
@@ -245,13 +246,15 @@ class LogCleaner:
         
         return results
     
-    def _is_likely_active_log(self, log_file: Path) -> bool:
+    def _is_likely_active_log(self, log_file: Path, mtime: Optional[float] = None) -> bool:
         """Check if log file is likely still being written to"""
         try:
-            stat_info = log_file.stat()
+            # Callers that already stat'ed the file pass st_mtime to skip a syscall
+            if mtime is None:
+                mtime = log_file.stat().st_mtime
             
             # Check if modified recently (within last hour)
-            modified_time = datetime.fromtimestamp(stat_info.st_mtime)
+            modified_time = datetime.fromtimestamp(mtime)
             if datetime.now() - modified_time < timedelta(hours=1):
                 return True
             
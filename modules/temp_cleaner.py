@@ -12,6 +12,12 @@ from core.progress import ProgressTracker, ProgressType
 
 logger = logging.getLogger(__name__)
 
+# Temporary file extensions, as a tuple so str.endswith can test them all in C
+_TEMP_EXTENSIONS = (
+    '.tmp', '.temp', '.~', '.bak', '.old', '.cache',
+    '.log', '.pid', '.lock', '.swp', '.swo'
+)
+
 class TempCleaner:
     """Specialized cleaner for temporary files"""
     
@@ -174,11 +180,11 @@ class TempCleaner:
     
     def _has_temp_extension(self, file_path: Path) -> bool:
         """Check if file has temporary extension"""
-        temp_extensions = {
-            '.tmp', '.temp', '.~', '.bak', '.old', '.cache',
-            '.log', '.pid', '.lock', '.swp', '.swo'
-        }
-        return file_path.suffix.lower() in temp_extensions
+        name = file_path.name.lower()
+        # A dotfile such as '.lock' has no suffix, as with Path.suffix
+        if name.startswith('.') and name.count('.') == 1:
+            return False
+        return name.endswith(_TEMP_EXTENSIONS)
     
     def _check_locked_files(self, categorized_files: Dict[str, List[Path]]) -> None:
         """Check which files are locked and move to separate category"""
@@ -24,9 +24,9 @@ def temp_dir():
     yield temp_path
     shutil.rmtree(temp_path, ignore_errors=True)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings():
-    """Create test settings configuration"""
+    """Create test settings configuration (shared across the session)"""
     test_config = {
         'scan_paths': [],
         'backup_enabled': False,
@@ -46,9 +46,14 @@ def cleaner_engine(test_settings):
     """Create cleaner engine with test settings"""
     return CleanerEngine(test_settings)
 
-@pytest.fixture
-def sample_files(temp_dir):
-    """Create sample files for testing"""
+@pytest.fixture(scope="session")
+def sample_dir(tmp_path_factory):
+    """Create directory shared by read-only sample files"""
+    return tmp_path_factory.mktemp('shared_sample', numbered=False)
+
+@pytest.fixture(scope="session")
+def sample_files(sample_dir):
+    """Create sample files for testing (shared, tests must not modify them)"""
     files = {
         'temp_files': [],
         'cache_files': [],
@@ -60,12 +65,12 @@ def sample_files(temp_dir):
     # Create temp files
     temp_files = ['test.tmp', 'old_file.temp', 'cache.cache']
     for filename in temp_files:
-        file_path = temp_dir / filename
+        file_path = sample_dir / filename
         file_path.write_text(f'Test content for {filename}')
         files['temp_files'].append(file_path)
     
     # Create cache files
-    cache_dir = temp_dir / 'cache'
+    cache_dir = sample_dir / 'cache'
     cache_dir.mkdir()
     cache_files = ['browser.cache', 'app.cache']
     for filename in cache_files:
@@ -76,7 +81,7 @@ def sample_files(temp_dir):
     # Create log files
     log_files = ['application.log', 'debug.log']
     for filename in log_files:
-        file_path = temp_dir / filename
+        file_path = sample_dir / filename
         file_path.write_text(f'Log content for {filename}\n' * 100)
         files['log_files'].append(file_path)
     
@@ -2,14 +2,37 @@
 End-to-end tests using Playwright for web interface
 """
 
+import os
+import re
 import pytest
-from playwright.sync_api import Page, expect
 import subprocess
 import time
 import threading
 from pathlib import Path
 import sys
 
+def _browsers_installed() -> bool:
+    """Check whether Playwright has downloaded any Chromium build"""
+    browsers_path = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if browsers_path and browsers_path != '0':
+        candidates = [Path(browsers_path)]
+    else:
+        candidates = [
+            Path(os.environ.get('LOCALAPPDATA', '')) / 'ms-playwright',
+            Path.home() / '.cache' / 'ms-playwright',
+            Path.home() / 'Library' / 'Caches' / 'ms-playwright'
+        ]
+    return any(any(path.glob('chromium*')) for path in candidates if path.is_dir())
+
+# Skip at collection time so neither Playwright nor the Flask server is loaded
+if os.environ.get('PLAYWRIGHT_SKIP', '') == '1':
+    pytest.skip("E2E tests disabled via PLAYWRIGHT_SKIP=1", allow_module_level=True)
+pytest.importorskip('playwright.sync_api')
+if not _browsers_installed():
+    pytest.skip("Playwright browsers are not installed", allow_module_level=True)
+
+from playwright.sync_api import Page, expect
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -20,14 +43,13 @@ class TestWebInterfaceE2E:
     @pytest.fixture(scope="class", autouse=True)
     def setup_server(self):
         """Start Flask server for testing"""
-        import os
-        os.chdir(project_root / 'web')
+        from web.app import app, socketio
         
         # Start server in background thread
         def run_server():
             try:
-                from web.app import app, socketio
-                socketio.run(app, host='127.0.0.1', port=5555, debug=False)
+                socketio.run(app, host='127.0.0.1', port=5555, debug=False,
+                             allow_unsafe_werkzeug=True, log_output=False)
             except Exception as e:
                 print(f"Server start error: {e}")
         
@@ -54,7 +76,7 @@ class TestWebInterfaceE2E:
         
         # Check navigation
         expect(page.locator(".navbar-brand")).to_contain_text("Ultra-Turbo AppData Cleaner")
-        expect(page.locator(".nav-link[href='/'].")).to_have_class(/active/)
+        expect(page.locator(".nav-link[href='/']")).to_have_class(re.compile(r"active"))
     
     def test_navigation_between_pages(self, page: Page):
         """Test navigation between different pages"""
@@ -156,12 +178,11 @@ class TestWebInterfaceE2E:
     
     def test_api_endpoints(self, page: Page):
         """Test that API endpoints respond"""
-        # Test system info API
-        response = page.goto("http://127.0.0.1:5555/api/system/info")
+        # Plain HTTP checks through the API request context, no page navigation
+        response = page.request.get("http://127.0.0.1:5555/api/system/info")
         assert response.status == 200
         
-        # Test settings API  
-        response = page.goto("http://127.0.0.1:5555/api/settings")
+        response = page.request.get("http://127.0.0.1:5555/api/settings")
         assert response.status == 200
     
     def test_responsive_design(self, page: Page):
@@ -4,9 +4,10 @@ Tests for core modules
 
 import pytest
 import asyncio
+from datetime import timedelta
 from pathlib import Path
 
-from core.scanner import FileScanner
+from core.scanner import FileScanner, ScanBatch
 from core.analyzer import FileAnalyzer, FileCategory, FileSafetyLevel
 from core.safety import SafetyChecker
 from core.progress import ProgressTracker, OperationStatus
@@ -26,15 +27,43 @@ class TestFileScanner:
         assert isinstance(results, list)
     
     @pytest.mark.asyncio
-    async def test_scan_path_with_files(self, test_settings, sample_files, temp_dir):
+    async def test_scan_path_with_files(self, test_settings, sample_files, sample_dir):
         scanner = FileScanner(test_settings)
-        results = await scanner.scan_path(str(temp_dir))
+        results = await scanner.scan_path(str(sample_dir))
         
         assert len(results) > 0
         assert all('path' in result for result in results)
         assert all('size' in result for result in results)
         assert all('name' in result for result in results)
 
+    @pytest.mark.asyncio
+    async def test_scan_path_batch_matches_scan_path(self, test_settings, sample_files, sample_dir):
+        scanner = FileScanner(test_settings)
+        files = await scanner.scan_path(str(sample_dir))
+        batch = await scanner.scan_path_batch(str(sample_dir))
+        
+        assert isinstance(batch, ScanBatch)
+        assert sorted(batch.paths) == sorted(f['path'] for f in files)
+
+class TestScanBatch:
+    """Test ScanBatch columnar container"""
+    
+    def test_from_files_roundtrip(self):
+        files = [
+            {'path': '/test/a.tmp', 'size': 10, 'extension': '.tmp', 'age_days': 3,
+             'category': 'temp', 'safety_level': 1, 'cleanable': True},
+            {'path': '/test/b.log', 'size': 20, 'extension': '.log', 'age_days': 40}
+        ]
+        batch = ScanBatch.from_files(files)
+        
+        assert len(batch) == 2
+        assert batch[0]['name'] == 'a.tmp'
+        assert batch[0]['cleanable'] is True
+        assert batch[1]['category'] == 'unknown'
+        assert batch[-1]['size'] == 20
+        assert [f['path'] for f in batch[:1]] == ['/test/a.tmp']
+        assert list(batch.cleanable_sizes()) == [10]
+
 class TestFileAnalyzer:
     """Test FileAnalyzer functionality"""
     
@@ -159,4 +188,22 @@ class TestProgressTracker:
         
         progress = progress_tracker.get_progress(operation_id)
         assert progress.status == OperationStatus.COMPLETED
-        assert progress.end_time is not None
\ No newline at end of file
+        assert progress.end_time is not None
+    
+    def test_add_callback(self, progress_tracker):
+        seen = []
+        progress_tracker.add_callback(lambda progress: seen.append(progress.status))
+        
+        progress_tracker.start_operation('test_callback', 10)
+        progress_tracker.update_progress('test_callback', 5)
+        progress_tracker.complete_operation('test_callback', True)
+        
+        assert seen == [OperationStatus.RUNNING, OperationStatus.RUNNING, OperationStatus.COMPLETED]
+    
+    def test_complete_operation_elapsed_time(self, progress_tracker):
+        operation_id = 'test_elapsed'
+        progress_tracker.start_operation(operation_id, 10)
+        progress_tracker.complete_operation(operation_id, True)
+        
+        progress = progress_tracker.get_progress(operation_id)
+        assert progress.elapsed_time >= timedelta(0)
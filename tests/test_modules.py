@@ -49,7 +49,8 @@ class TestTempCleaner:
         cleaner = TempCleaner(progress_tracker)
         
         temp_files = [Path('test.tmp'), Path('old.temp'), Path('cache.cache')]
-        normal_files = [Path('document.pdf'), Path('image.jpg'), Path('script.py')]
+        normal_files = [Path('document.pdf'), Path('image.jpg'), Path('script.py'),
+                        Path('.lock'), Path('.cache'), Path('.log')]
         
         for temp_file in temp_files:
             assert cleaner._has_temp_extension(temp_file) == True
@@ -135,6 +136,19 @@ class TestBrowserCleaner:
         assert cleaner._format_bytes(1024) == '1.0 KB'
         assert cleaner._format_bytes(1024 * 1024) == '1.0 MB'
         assert cleaner._format_bytes(1024 * 1024 * 1024) == '1.0 GB'
+    
+    def test_clean_directory(self, progress_tracker, temp_dir):
+        cache_dir = temp_dir / 'Cache'
+        (cache_dir / 'nested').mkdir(parents=True)
+        (cache_dir / 'data_0').write_bytes(b'x' * 100)
+        (cache_dir / 'nested' / 'data_1').write_bytes(b'x' * 50)
+        
+        cleaner = BrowserCleaner(progress_tracker)
+        result = cleaner._clean_directory(cache_dir)
+        
+        assert result == {'files_deleted': 2, 'bytes_freed': 150}
+        assert (cache_dir / 'nested').is_dir()
+        assert not any(path.is_file() for path in cache_dir.rglob('*'))
 
 class TestLogCleaner:
     """Test LogCleaner module"""
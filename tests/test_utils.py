@@ -0,0 +1,197 @@
+"""
+Tests for utility modules
+"""
+
+import io
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import utils.backup_manager as backup_manager
+from utils.backup_manager import BackupManager
+from utils.file_operations import FileOperations
+from utils.formatters import Formatters
+
+def _make_files(root: Path) -> dict:
+    """Write a mix of small, compressible, incompressible and empty files"""
+    root.mkdir(parents=True, exist_ok=True)
+    contents = {
+        'small.txt': b'hello backup',
+        'repeat.log': b'0123456789abcdef' * 8192,
+        'photo.jpg': bytes(range(256)) * 64,
+        'empty.tmp': b'',
+    }
+    for name, data in contents.items():
+        (root / name).write_bytes(data)
+    return {root / name: data for name, data in contents.items()}
+
+class TestBackupManager:
+    """Test BackupManager functionality"""
+    
+    @pytest.fixture
+    def manager(self, temp_dir):
+        return BackupManager({'backup_path': str(temp_dir / 'backups')})
+    
+    def _assert_zip_round_trip(self, manager, temp_dir):
+        files = _make_files(temp_dir / 'src')
+        backup_path = manager.create_backup(list(files), 'zip_test')
+        assert backup_path is not None
+        
+        with zipfile.ZipFile(backup_path) as zipf:
+            # testzip() re-reads every entry and checks it against the stored CRC
+            assert zipf.testzip() is None
+            for file_path, data in files.items():
+                assert zipf.read(file_path.name) == data
+    
+    def test_zip_backup_crc(self, manager, temp_dir):
+        self._assert_zip_round_trip(manager, temp_dir)
+    
+    def test_zip_backup_crc_without_precompressed(self, manager, temp_dir, monkeypatch):
+        monkeypatch.setattr(backup_manager, '_PRECOMPRESSED_SUPPORTED', False)
+        self._assert_zip_round_trip(manager, temp_dir)
+    
+    def test_compress_entries_bounds_inflight_bytes(self, manager, temp_dir, monkeypatch):
+        files = _make_files(temp_dir / 'big')
+        submitted = []
+        monkeypatch.setattr(backup_manager, 'MAX_INFLIGHT_BYTES', 1)
+        monkeypatch.setattr(backup_manager, '_compress_for_zip',
+                            lambda file_path, zinfo, level: submitted.append(file_path))
+        
+        entries = []
+        for file_path in files:
+            st = file_path.stat()
+            entries.append((file_path, backup_manager._zip_info(file_path.name, st), st))
+        
+        # With a one-byte budget every non-empty entry is handed back before the next is queued
+        for (file_path, _, st), future in manager._compress_entries(entries, 1):
+            future.result()
+            assert submitted[-1] == file_path or st.st_size == 0
+    
+    def test_list_and_delete_backup(self, manager, temp_dir):
+        files = _make_files(temp_dir / 'src')
+        backup_path = manager.create_backup(list(files), 'list_test')
+        assert backup_manager._manifest_sidecar(backup_path).is_file()
+        
+        backups = manager.list_backups()
+        assert [b['path'] for b in backups] == [str(backup_path)]
+        assert backups[0]['operation_name'] == 'list_test'
+        assert backups[0]['file_count'] == len(files)
+        assert backup_path in manager._backup_info_cache
+        
+        assert manager.delete_backup(backup_path)
+        assert backup_path not in manager._backup_info_cache
+        assert not backup_manager._manifest_sidecar(backup_path).exists()
+        assert manager.list_backups() == []
+    
+    def test_zip_backup_restore_round_trip(self, manager, temp_dir):
+        files = _make_files(temp_dir / 'src')
+        backup_path = manager.create_backup(list(files), 'restore_test')
+        
+        for file_path in files:
+            file_path.unlink()
+        
+        assert manager.restore_backup(backup_path)
+        for file_path, data in files.items():
+            assert file_path.read_bytes() == data
+    
+    def test_restore_rejects_corrupt_stored_entry(self, manager, temp_dir):
+        files = _make_files(temp_dir / 'src')
+        backup_path = manager.create_backup(list(files), 'corrupt_test')
+        
+        # photo.jpg is stored uncompressed, so its bytes appear verbatim in the archive
+        archive = bytearray(backup_path.read_bytes())
+        offset = archive.index(bytes(range(256)) * 64)
+        archive[offset + 100] ^= 0xFF
+        backup_path.write_bytes(archive)
+        
+        with zipfile.ZipFile(backup_path) as zipf:
+            assert zipf.getinfo('photo.jpg').compress_type == zipfile.ZIP_STORED
+            with pytest.raises(zipfile.BadZipFile):
+                backup_manager._extract_zip_entry(zipf, 'photo.jpg', temp_dir / 'restored.jpg')
+    
+    def test_fixed_size_reader_pads_and_truncates(self):
+        shrunk = backup_manager._FixedSizeReader(io.BytesIO(b'abc'), 5)
+        assert shrunk.read(4) == b'abc\0'
+        assert shrunk.read(4) == b'\0'
+        assert shrunk.read(4) == b''
+        assert shrunk.padded == 2
+        
+        grown = backup_manager._FixedSizeReader(io.BytesIO(b'abcdef'), 4)
+        assert grown.read() == b'abcd'
+        assert grown.padded == 0
+    
+    def test_zst_backup_round_trip_with_shrinking_file(self, manager, temp_dir, monkeypatch):
+        pytest.importorskip('zstandard')
+        files = _make_files(temp_dir / 'src')
+        shrinking = temp_dir / 'src' / 'repeat.log'
+        real_open = open
+        
+        def open_truncated(path, *args, **kwargs):
+            # Simulate another process truncating the file between stat() and read
+            if Path(path) == shrinking:
+                shrinking.write_bytes(b'cut')
+            return real_open(path, *args, **kwargs)
+        
+        monkeypatch.setattr('builtins.open', open_truncated)
+        backup_path = manager.create_backup(list(files), 'zst_test', compression='zstd')
+        monkeypatch.setattr('builtins.open', real_open)
+        assert backup_path is not None
+        
+        for file_path in files:
+            file_path.unlink()
+        
+        assert manager.restore_backup(backup_path)
+        for file_path, data in files.items():
+            if file_path == shrinking:
+                assert file_path.read_bytes() == b'cut' + bytes(len(data) - 3)
+            else:
+                assert file_path.read_bytes() == data
+
+class TestFileOperations:
+    """Test FileOperations functionality"""
+    
+    def test_fast_copy_same_file_keeps_data(self, temp_dir):
+        file_path = temp_dir / 'a.txt'
+        file_path.write_bytes(b'keep me')
+        
+        with pytest.raises(shutil.SameFileError):
+            FileOperations._fast_copy(file_path, file_path)
+        assert not FileOperations.safe_copy_file(file_path, file_path, overwrite=True)
+        assert file_path.read_bytes() == b'keep me'
+    
+    def test_fast_copy_into_directory(self, temp_dir):
+        file_path = temp_dir / 'a.txt'
+        file_path.write_bytes(b'data')
+        target_dir = temp_dir / 'target'
+        target_dir.mkdir()
+        
+        FileOperations._fast_copy(file_path, target_dir)
+        assert (target_dir / 'a.txt').read_bytes() == b'data'
+
+class TestFormatters:
+    """Test Formatters functionality"""
+    
+    def test_format_bytes_non_finite(self):
+        assert Formatters.format_bytes(float('inf')) == "inf PB"
+        assert Formatters.format_bytes(float('nan')) == "nan B"
+        assert Formatters.format_bytes(float('-inf')) == "-inf B"
+    
+    def test_format_table_rows_alignment(self):
+        rows = [['cache', 1024], ['a_very_long_name', 7]]
+        assert Formatters.format_table_rows(rows, [10, 6]) == [
+            'cache      |   1024',
+            'a_very_... |      7',
+        ]
+    
+    def test_format_table_rows_empty(self):
+        assert Formatters.format_table_rows([], [10, 6]) == []
+    
+    def test_format_progress_bar_clamps(self):
+        assert Formatters.format_progress_bar(-5, 10, width=4) == "[░░░░] 0.0%"
+        assert Formatters.format_progress_bar(15, 10, width=4) == "[████] 100.0%"
+    
+    @pytest.mark.parametrize('value', [0, 1, 1023, 1024, 1024 ** 2 - 1, 1024 ** 5, 3 * 1024 ** 5 + 7])
+    def test_format_bytes_int_matches_float(self, value):
+        assert Formatters.format_bytes_int(value) == Formatters.format_bytes(float(value))
@@ -3,20 +3,29 @@ Tests for web interface
 """
 
 import pytest
+import os
 import json
+import hashlib
 from pathlib import Path
 import sys
+import time
+import threading
+from flask import Flask, request
+from flask_socketio import SocketIO
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / 'web'))
+# Appended so the project's utils package is not shadowed by web/utils
+sys.path.append(str(project_root / 'web'))
 
 from web.app import app
 from web.api.system import SystemAPI
 from web.api.scanner import ScannerAPI
 from web.api.cleaner import CleanerAPI
-from core.progress import ProgressTracker
+from web.utils import HashCalculator, HashCache, SizeCalculator
+from web.websocket_handler import WebSocketHandler, DASHBOARD_ROOM, operation_room
+from core.progress import ProgressTracker, OperationStatus
 
 class TestWebApp:
     """Test Flask web application"""
@@ -50,6 +59,10 @@ class TestWebApp:
         response = client.get('/logs')
         assert response.status_code == 200
         assert b'System Logs' in response.data
+    
+    def test_json_keys_sorted(self):
+        """API responses keep Flask's sorted key order"""
+        assert list(json.loads(app.json.dumps({'b': 1, 'a': 2}))) == ['a', 'b']
 
 class TestSystemAPI:
     """Test System API functionality"""
@@ -78,6 +91,16 @@ class TestSystemAPI:
         if 'error' not in potential:
             assert 'estimated_cleanup_mb' in potential
             assert 'estimated_file_count' in potential
+    
+    def test_directory_summary_time_budget(self, temp_dir):
+        for i in range(3):
+            (temp_dir / f'file_{i}.tmp').write_bytes(b'x' * 10)
+        (temp_dir / 'sub').mkdir()
+        api = SystemAPI()
+        
+        assert api._get_directory_summary(temp_dir) == (30, 3, 1)
+        # An exhausted budget stops the pass before the first entry
+        assert api._get_directory_summary(temp_dir, time_budget=-1) == (0, 0, 0)
 
 class TestScannerAPI:
     """Test Scanner API functionality"""
@@ -127,6 +150,237 @@ class TestScannerAPI:
         assert 'log' in results['categories']
         assert '.tmp' in results['extensions']
 
+class TestHashCalculator:
+    """Test HashCalculator functionality"""
+    
+    def test_calculate_many_matches_single_file(self, temp_dir):
+        small = temp_dir / 'small.bin'
+        small.write_bytes(b'small file')
+        large = temp_dir / 'large.bin'  # At or above MMAP_HASH_THRESHOLD, hashed via mmap
+        large.write_bytes(bytes(range(256)) * 512)
+        missing = temp_dir / 'missing.bin'
+        
+        results = HashCalculator.calculate_many([small, large, missing], 'sha256')
+        assert list(results) == [small, large, missing]
+        assert results[small] == HashCalculator.calculate_sha256(small)
+        assert results[large] == HashCalculator.calculate_sha256(large)
+        assert results[large] == hashlib.sha256(large.read_bytes()).hexdigest()
+        assert results[missing] is None
+        
+        md5_results = HashCalculator.calculate_many([small, large], 'md5')
+        assert md5_results[large] == hashlib.md5(large.read_bytes()).hexdigest()
+    
+    def test_hash_cache_hit_and_miss(self, temp_dir):
+        file_path = temp_dir / 'cached.bin'
+        file_path.write_bytes(b'a' * 65536)
+        cache = HashCache(temp_dir / 'hashes.db')
+        st = file_path.stat()
+        
+        assert cache.get(file_path, 'sha256', st) is None
+        cache.put(file_path, 'sha256', st, 'digest')
+        assert cache.get(file_path, 'sha256', st) == 'digest'
+        assert cache.get(file_path, 'md5', st) is None
+        cache.close()
+    
+    def test_hash_cache_invalidated_by_size_and_mtime(self, temp_dir):
+        file_path = temp_dir / 'cached.bin'
+        file_path.write_bytes(b'a' * 65536)
+        cache = HashCache(temp_dir / 'hashes.db')
+        st = file_path.stat()
+        cache.put(file_path, 'sha256', st, 'digest')
+        
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache.get(file_path, 'sha256', file_path.stat()) is None
+        
+        file_path.write_bytes(b'a' * 65537)
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert cache.get(file_path, 'sha256', file_path.stat()) is None
+        cache.close()
+    
+    def test_hash_cache_reopen(self, temp_dir):
+        file_path = temp_dir / 'cached.bin'
+        file_path.write_bytes(b'a' * 65536)
+        db_path = temp_dir / 'hashes.db'
+        
+        cache = HashCache(db_path)
+        digest = HashCalculator.calculate_sha256(file_path, cache=cache)
+        cache.close()
+        
+        reopened = HashCache(db_path)
+        assert reopened.get(file_path, 'sha256', file_path.stat()) == digest
+        assert HashCalculator.calculate_sha256(file_path, cache=reopened) == digest
+        reopened.close()
+    
+    def test_find_duplicates(self, temp_dir, monkeypatch):
+        original = temp_dir / 'original.bin'
+        original.write_bytes(b'same content' * 100)
+        copy = temp_dir / 'copy.bin'
+        copy.write_bytes(b'same content' * 100)
+        other = temp_dir / 'other.bin'  # Same size, different bytes
+        other.write_bytes(b'other conten' * 100)
+        unique = temp_dir / 'unique.bin'
+        unique.write_bytes(b'unique')
+        files = [original, copy, other, unique]
+        
+        compared = []
+        real_same_content = HashCalculator._same_content
+        monkeypatch.setattr(HashCalculator, '_same_content',
+                            staticmethod(lambda a, b: compared.append(b) or real_same_content(a, b)))
+        
+        duplicates = HashCalculator.find_duplicates(files)
+        assert list(duplicates.values()) == [[original, copy]]
+        assert compared == [copy]
+        
+        assert HashCalculator.find_duplicates(files, verify=False) == duplicates
+        assert compared == [copy]
+
+class TestSizeCalculator:
+    """Test SizeCalculator functionality"""
+    
+    @pytest.mark.parametrize('size_bytes, expected', [
+        (0, '0 B'),
+        (1023, '1023.0 B'),
+        (1024, '1.0 KB'),
+        (1024 ** 5 * 3, '3.0 PB'),
+        (-5000, '-5000.0 B'),
+        (float('inf'), 'inf PB'),
+        (float('nan'), 'nan B'),
+    ])
+    def test_format_size(self, size_bytes, expected):
+        assert SizeCalculator.format_size(size_bytes) == expected
+
+class _RecordingSocketIO:
+    """Socket.IO stand-in that records emits and runs background tasks on demand"""
+    
+    def __init__(self):
+        self.emitted = []
+        self.tasks = []
+    
+    def emit(self, event, data=None, to=None):
+        self.emitted.append((event, data))
+    
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+    
+    def sleep(self, seconds):
+        pass
+    
+    def run_tasks(self):
+        while self.tasks:
+            target, args = self.tasks.pop(0)
+            target(*args)
+
+class _StubSystemAPI:
+    """SystemAPI stand-in that counts get_system_info() calls"""
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+    
+    def get_system_info(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {'cpu': {'percentage': 0}}
+
+class TestWebSocketHandler:
+    """Test WebSocketHandler progress broadcasting"""
+    
+    @pytest.fixture
+    def socketio(self):
+        return _RecordingSocketIO()
+    
+    def test_progress_updates_coalesced(self, socketio, progress_tracker):
+        handler = WebSocketHandler(socketio, progress_tracker, _StubSystemAPI())
+        progress_tracker.create_operation('op', 'Scan', total_items=100)
+        progress_tracker.start_operation('op', total_items=100)
+        for current in range(1, 51):
+            progress_tracker.update_progress('op', current=current)
+        
+        assert socketio.emitted == []
+        assert socketio.tasks.count((handler._flush_pending, ())) == 1
+        socketio.run_tasks()
+        
+        updates = [data for event, data in socketio.emitted if event == 'progress_update']
+        assert len(updates) == 1
+        assert updates[0]['current'] == 50
+    
+    def test_final_event_not_followed_by_progress(self, socketio, progress_tracker):
+        WebSocketHandler(socketio, progress_tracker, _StubSystemAPI())
+        progress_tracker.create_operation('op', 'Scan', total_items=10)
+        progress_tracker.start_operation('op', total_items=10)
+        progress_tracker.update_progress('op', current=5)
+        
+        # The tracker flips the status before notifying; a flush can run in between
+        progress = progress_tracker.get_progress('op')
+        progress.status = OperationStatus.COMPLETED
+        socketio.run_tasks()
+        progress.status = OperationStatus.RUNNING
+        progress_tracker.complete_operation('op')
+        socketio.run_tasks()
+        
+        events = [event for event, data in socketio.emitted]
+        assert events.count('operation_completed') == 1
+        assert events[-1] == 'operation_completed'
+        assert [data['status'] for event, data in socketio.emitted
+                if event == 'progress_update'] == ['completed']
+    
+    def test_cold_system_info_fetched_once(self, socketio, progress_tracker):
+        system_api = _StubSystemAPI(delay=0.05)
+        handler = WebSocketHandler(socketio, progress_tracker, system_api)
+        assert socketio.tasks == [(handler._system_info_loop, ())]
+        
+        # A mass reconnect before the refresh loop has run
+        threads = [threading.Thread(target=handler.handle_client_connect, args=(f'sid{i}',))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert system_api.calls == 1
+        assert [event for event, data in socketio.emitted] == ['initial_system_info'] * 8
+        assert socketio.tasks == [(handler._system_info_loop, ())]
+    
+    def test_rooms_and_client_count(self, progress_tracker):
+        flask_app = Flask(__name__)
+        socketio = SocketIO(flask_app)
+        handler = WebSocketHandler(socketio, progress_tracker, _StubSystemAPI())
+        socketio.on_event('connect', lambda *args: handler.handle_client_connect(request.sid))
+        socketio.on_event('disconnect', lambda *args: handler.handle_client_disconnect(request.sid))
+        socketio.on_event('subscribe', lambda data: handler.subscribe(data['room']))
+        socketio.on_event('unsubscribe', lambda data: handler.unsubscribe(data['room']))
+        
+        def received(client, name):
+            # The refresh loop also pushes snapshots to the dashboard room, so match on payload
+            return [event['args'][0] for event in client.get_received()
+                    if event['name'] == name and event['args'][0].get('stats') != {'cpu': {'percentage': 0}}]
+        
+        dashboard = socketio.test_client(flask_app)
+        other = socketio.test_client(flask_app)
+        assert handler.get_connected_clients_count() == 2
+        assert len(received(dashboard, 'initial_system_info')) == 1
+        other.get_received()
+        
+        dashboard.emit('subscribe', {'room': DASHBOARD_ROOM})
+        handler.broadcast_system_stats({'cpu': 1}, room=DASHBOARD_ROOM)
+        assert len(received(dashboard, 'system_stats_update')) == 1
+        assert received(other, 'system_stats_update') == []
+        
+        dashboard.emit('unsubscribe', {'room': DASHBOARD_ROOM})
+        handler.broadcast_system_stats({'cpu': 2}, room=DASHBOARD_ROOM)
+        assert received(dashboard, 'system_stats_update') == []
+        
+        # Progress ticks reach only the operation's room
+        progress_tracker.create_operation('op1', 'Scan', total_items=10)
+        other.emit('subscribe', {'room': operation_room('op1')})
+        handler._emit_progress(progress_tracker.get_progress('op1'))
+        assert [data['operation_id'] for data in received(other, 'progress_update')] == ['op1']
+        assert received(dashboard, 'progress_update') == []
+        
+        dashboard.disconnect()
+        other.disconnect()
+        assert handler.get_connected_clients_count() == 0
+
 class TestAPIEndpoints:
     """Test API endpoints"""
     
@@ -173,4 +427,21 @@ class TestAPIEndpoints:
         
         assert response.status_code == 200
         data = json.loads(response.data)
-        assert data.get('status') == 'success' or 'error' in data
\ No newline at end of file
+        assert data.get('status') == 'success' or 'error' in data
+    
+    def test_api_settings_conditional_get(self, client):
+        """Test GET /api/settings answers If-None-Match with 304 until settings change"""
+        response = client.get('/api/settings')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        
+        response = client.get('/api/settings', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        
+        client.post('/api/settings', data=json.dumps({'safe_mode': True}),
+                    content_type='application/json')
+        
+        response = client.get('/api/settings', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
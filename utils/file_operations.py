@@ -2,15 +2,46 @@
 Low-level file system operations utilities
 """
 import os
+import sys
+import stat
+import queue
 import shutil
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
 import logging
 from datetime import datetime
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# ioctl request for a copy-on-write clone on btrfs/xfs (_IOW(0x94, 9, int))
+FICLONE = 0x40049409 if sys.platform.startswith('linux') and fcntl is not None else None
+
+# Directory walks are syscall-bound and scandir/stat release the GIL
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# rmtree's error callback was renamed in 3.12 and receives the exception itself
+_RMTREE_ERROR_ARG = 'onexc' if sys.version_info >= (3, 12) else 'onerror'
+
+# Chunk size for the plain read/write copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+_copy_file2 = None
+if os.name == 'nt':
+    try:
+        import ctypes
+        _copy_file2 = ctypes.windll.kernel32.CopyFile2  # Windows 8+
+        _copy_file2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+        _copy_file2.restype = ctypes.c_long
+    except (ImportError, AttributeError, OSError):
+        _copy_file2 = None
+
 class FileOperations:
     """Low-level file operations with safety checks"""
     
@@ -26,12 +57,14 @@ class FileOperations:
                 logger.warning(f"Path is not a file: {file_path}")
                 return False
             
-            # Check if file is in use
-            if FileOperations._is_file_locked(file_path):
+            # Windows refuses to delete files that are open elsewhere; POSIX never does,
+            # so attempting the delete is the only lock check that means anything
+            try:
+                file_path.unlink()
+            except PermissionError:
                 logger.warning(f"File is locked/in use: {file_path}")
                 return False
             
-            file_path.unlink()
             logger.debug(f"Deleted file: {file_path}")
             return True
             
@@ -39,6 +72,30 @@ class FileOperations:
             logger.error(f"Failed to delete file {file_path}: {e}")
             return False
     
+    @staticmethod
+    def safe_delete_entries(entries: Iterable[os.DirEntry]) -> Tuple[int, int]:
+        """Bulk-delete scandir entries (files via unlink, empty dirs via rmdir); returns (count, bytes freed)
+        
+        Meant for loops that already hold DirEntry objects, so no Path is built
+        and nothing is re-checked per entry beyond the size lookup.
+        """
+        deleted = 0
+        bytes_freed = 0
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    os.rmdir(entry.path)
+                else:
+                    size = entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+                    bytes_freed += size
+                deleted += 1
+            except FileNotFoundError:
+                continue
+            except OSError as e:  # Locked, permission denied or non-empty directory
+                logger.debug(f"Could not delete {entry.path}: {e}")
+        return deleted, bytes_freed
+    
     @staticmethod
     def safe_delete_directory(dir_path: Union[str, Path], recursive: bool = False) -> bool:
         """Safely delete a directory"""
@@ -52,7 +109,18 @@ class FileOperations:
                 return False
             
             if recursive:
-                shutil.rmtree(dir_path)
+                # rmtree already uses fd-relative scandir/unlink/rmdir where the OS supports
+                # them; the callback keeps one locked file from aborting the rest of the tree
+                failed = []
+                
+                def log_and_continue(func, path, error):
+                    failed.append(path)
+                    logger.warning(f"Could not remove {path}: {error[1] if isinstance(error, tuple) else error}")
+                
+                shutil.rmtree(dir_path, **{_RMTREE_ERROR_ARG: log_and_continue})
+                if failed:
+                    logger.warning(f"Directory partially deleted ({len(failed)} removals failed): {dir_path}")
+                    return False
                 logger.debug(f"Deleted directory recursively: {dir_path}")
             else:
                 dir_path.rmdir()  # Only works if empty
@@ -83,7 +151,7 @@ class FileOperations:
             # Create destination directory if needed
             destination.parent.mkdir(parents=True, exist_ok=True)
             
-            shutil.copy2(source, destination)
+            FileOperations._fast_copy(source, destination)
             logger.debug(f"Copied file: {source} -> {destination}")
             return True
             
@@ -113,16 +181,76 @@ class FileOperations:
             logger.error(f"Failed to move file {source} -> {destination}: {e}")
             return False
     
+    @staticmethod
+    def _fast_copy(source: Union[str, Path], destination: Union[str, Path]) -> None:
+        """Copy file data with the cheapest mechanism the OS offers, then its metadata"""
+        source, destination = os.fspath(source), os.fspath(destination)
+        if os.path.isdir(destination):
+            destination = os.path.join(destination, os.path.basename(source))
+        
+        # Opening the destination for writing would truncate the source if both are one file
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+        
+        # CopyFile2 lets Windows do server-side copies on SMB shares
+        if _copy_file2 is None or _copy_file2(source, destination, None) < 0:
+            with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+                FileOperations._copy_file_data(fsrc, fdst)
+        
+        shutil.copystat(source, destination)
+    
+    @staticmethod
+    def _copy_file_data(fsrc, fdst) -> None:
+        """Copy between open files: reflink, copy_file_range, sendfile, then read/write"""
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        
+        if FICLONE is not None:
+            try:
+                fcntl.ioctl(out_fd, FICLONE, in_fd)
+                return
+            except OSError:
+                pass  # Not a CoW filesystem or crosses devices
+        
+        size = os.fstat(in_fd).st_size
+        copied = 0
+        
+        # copy_file_range allows NFS v4.2 server-side copies and in-kernel clones
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(in_fd, out_fd, size - copied, copied, copied)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+        
+        if copied < size and hasattr(os, 'sendfile'):
+            try:
+                os.lseek(out_fd, copied, os.SEEK_SET)
+                while copied < size:
+                    sent = os.sendfile(out_fd, in_fd, copied, size - copied)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+        
+        # Finish anything left, including files whose stat size is not their real size
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    
     @staticmethod
     def get_file_info(file_path: Union[str, Path]) -> Optional[Dict]:
         """Get detailed file information"""
         try:
             file_path = Path(file_path)
-            if not file_path.exists():
+            try:
+                stat_info = file_path.stat()
+            except FileNotFoundError:
                 return None
             
-            stat_info = file_path.stat()
-            
             return {
                 'path': str(file_path),
                 'name': file_path.name,
@@ -130,8 +258,8 @@ class FileOperations:
                 'created': datetime.fromtimestamp(stat_info.st_ctime),
                 'modified': datetime.fromtimestamp(stat_info.st_mtime),
                 'accessed': datetime.fromtimestamp(stat_info.st_atime),
-                'is_file': file_path.is_file(),
-                'is_directory': file_path.is_dir(),
+                'is_file': stat.S_ISREG(stat_info.st_mode),
+                'is_directory': stat.S_ISDIR(stat_info.st_mode),
                 'extension': file_path.suffix.lower(),
                 'parent': str(file_path.parent)
             }
@@ -161,18 +289,6 @@ class FileOperations:
             logger.error(f"Failed to create temp directory: {e}")
             return None
     
-    @staticmethod
-    def _is_file_locked(file_path: Path) -> bool:
-        """Check if file is locked/in use"""
-        try:
-            with open(file_path, 'r+b'):
-                pass
-            return False
-        except (PermissionError, OSError):
-            return True
-        except Exception:
-            return True
-    
     @staticmethod
     def ensure_directory_exists(dir_path: Union[str, Path]) -> bool:
         """Ensure directory exists, create if necessary"""
@@ -184,21 +300,79 @@ class FileOperations:
             logger.error(f"Failed to create directory {dir_path}: {e}")
             return False
     
+    @staticmethod
+    def _walk(dir_path: Union[str, Path]) -> Iterator[os.DirEntry]:
+        """Yield every entry below a directory using an iterative scandir DFS"""
+        stack = [os.fspath(dir_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        # DirEntry carries the dirent type, so this costs no syscall
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        yield entry
+            except OSError:
+                continue  # Unreadable or vanished directory
+    
+    @staticmethod
+    def _entry_size(entry: os.DirEntry) -> int:
+        """Size of a regular file entry, 0 for anything else"""
+        try:
+            if entry.is_file(follow_symlinks=False):
+                return entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+        return 0
+    
+    @staticmethod
+    def _tally_tree(dir_path: Union[str, Path], with_sizes: bool) -> Dict[str, int]:
+        """Count entries (and file bytes) below a directory, scanning subdirectories in parallel"""
+        pending = queue.Queue()
+        pending.put(os.fspath(dir_path))
+        tallies = []
+        
+        def worker():
+            tally = {'files': 0, 'directories': 0, 'total': 0, 'size': 0}
+            tallies.append(tally)
+            while True:
+                path = pending.get()
+                if path is None:
+                    return
+                try:
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            tally['total'] += 1
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    tally['directories'] += 1
+                                    pending.put(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    tally['files'] += 1
+                                    if with_sizes:
+                                        tally['size'] += entry.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                continue
+                except OSError:
+                    pass  # Unreadable or vanished directory
+                finally:
+                    pending.task_done()
+        
+        with ThreadPoolExecutor(max_workers=WALK_WORKERS) as pool:
+            for _ in range(WALK_WORKERS):
+                pool.submit(worker)
+            pending.join()
+            for _ in range(WALK_WORKERS):
+                pending.put(None)
+        
+        return {key: sum(tally[key] for tally in tallies)
+                for key in ('files', 'directories', 'total', 'size')}
+    
     @staticmethod
     def get_directory_size(dir_path: Union[str, Path]) -> int:
         """Get total size of directory in bytes"""
         try:
-            dir_path = Path(dir_path)
-            total_size = 0
-            
-            for item in dir_path.rglob('*'):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                    except (OSError, PermissionError):
-                        continue
-            
-            return total_size
+            return FileOperations._tally_tree(dir_path, with_sizes=True)['size']
             
         except Exception as e:
             logger.error(f"Failed to calculate directory size for {dir_path}: {e}")
@@ -208,19 +382,8 @@ class FileOperations:
     def count_files_in_directory(dir_path: Union[str, Path]) -> Dict[str, int]:
         """Count files and directories in path"""
         try:
-            dir_path = Path(dir_path)
-            counts = {'files': 0, 'directories': 0, 'total': 0}
-            
-            for item in dir_path.rglob('*'):
-                try:
-                    if item.is_file():
-                        counts['files'] += 1
-                    elif item.is_dir():
-                        counts['directories'] += 1
-                    counts['total'] += 1
-                except (OSError, PermissionError):
-                    continue
-            
+            counts = FileOperations._tally_tree(dir_path, with_sizes=False)
+            del counts['size']
             return counts
             
         except Exception as e:
@@ -1,29 +1,96 @@
 """
 Data formatting utilities
 """
-from typing import Union, Dict, Any
+from typing import List, Optional, Tuple, Union, Dict, Any
 from datetime import datetime, timedelta
+from collections import deque
 import json
+import math
+import time
+from functools import lru_cache
+
+try:
+    import orjson  # Optional C encoder for the pretty JSON output
+except ImportError:
+    orjson = None
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_DIVISORS = tuple(1024.0 ** i for i in range(len(_UNITS)))
+
+# Prebuilt progress bar strips, sliced instead of rebuilt on every update
+_BAR_WIDTH = 200
+_BAR_FULL = '█' * _BAR_WIDTH
+_BAR_EMPTY = '░' * _BAR_WIDTH
+
+@lru_cache(maxsize=1024)
+def _age_label(days: int, seconds: int) -> str:
+    """Human readable age from the days/seconds split of a timedelta"""
+    if days > 365:
+        years = days // 365
+        return f"{years} year{'s' if years > 1 else ''} ago"
+    elif days > 30:
+        months = days // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+    elif days > 0:
+        return f"{days} day{'s' if days > 1 else ''} ago"
+    elif seconds > 3600:
+        hours = seconds // 3600
+        return f"{hours} hour{'s' if hours > 1 else ''} ago"
+    elif seconds > 60:
+        minutes = seconds // 60
+        return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
+    else:
+        return "Just now"
+
+def now_iso() -> str:
+    """Current local time in datetime.isoformat() layout"""
+    dt = datetime.now()
+    stamp = (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+             f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
+    return f"{stamp}.{dt.microsecond:06d}" if dt.microsecond else stamp
 
 class Formatters:
     """Utilities for formatting data for display"""
     
+    # Progress updates repeat the same small counts and ratios, so the
+    # value-keyed formatters below are memoized
+    
     @staticmethod
     def format_bytes(bytes_value: Union[int, float]) -> str:
         """Format bytes in human readable format"""
         if bytes_value == 0:
             return "0 B"
+        if bytes_value < 1024:
+            return f"{bytes_value:.1f} B"
+        if type(bytes_value) is int:
+            return Formatters.format_bytes_int(bytes_value)
+        if not math.isfinite(bytes_value):
+            # Same output as the old division loop: nan stayed in B, inf climbed to PB
+            return f"{bytes_value:.1f} {_UNITS[0] if math.isnan(bytes_value) else _UNITS[-1]}"
         
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        
-        while bytes_value >= 1024.0 and unit_index < len(units) - 1:
-            bytes_value /= 1024.0
-            unit_index += 1
+        # Each unit spans 10 bits, so the bit length picks the unit without a division loop
+        unit_index = min((int(bytes_value).bit_length() - 1) // 10, len(_UNITS) - 1)
+        return f"{bytes_value / _DIVISORS[unit_index]:.1f} {_UNITS[unit_index]}"
+    
+    @staticmethod
+    def format_bytes_int(bytes_value: int) -> str:
+        """Format a non-negative byte count using integer arithmetic only"""
+        if bytes_value == 0:
+            return "0 B"
+        if bytes_value < 1024:
+            return f"{bytes_value}.0 B"
         
-        return f"{bytes_value:.1f} {units[unit_index]}"
+        unit_index = min((bytes_value.bit_length() - 1) // 10, len(_UNITS) - 1)
+        divisor = 1 << (unit_index * 10)
+        # Tenths of a unit, rounded half-to-even exactly like the float '.1f' path
+        tenths, remainder = divmod(bytes_value * 10, divisor)
+        if remainder * 2 > divisor or (remainder * 2 == divisor and tenths & 1):
+            tenths += 1
+        whole, frac = divmod(tenths, 10)
+        return f"{whole}.{frac} {_UNITS[unit_index]}"
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def format_duration(seconds: Union[int, float]) -> str:
         """Format duration in human readable format"""
         if seconds < 60:
@@ -49,12 +116,15 @@ class Formatters:
             else:
                 dt = timestamp
             
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
+            # Fixed ASCII layout, so skip strftime's format parsing and locale handling
+            return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                    f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
             
         except Exception:
             return str(timestamp)
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def format_percentage(value: Union[int, float], total: Union[int, float]) -> str:
         """Format percentage with proper handling of zero division"""
         if total == 0:
@@ -64,6 +134,7 @@ class Formatters:
         return f"{percentage:.1f}%"
     
     @staticmethod
+    @lru_cache(maxsize=1024, typed=True)
     def format_file_count(count: int) -> str:
         """Format file count with proper pluralization"""
         if count == 1:
@@ -77,71 +148,85 @@ class Formatters:
         return f"{Formatters.format_bytes(bytes_per_second)}/s"
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_progress_bar(current: int, total: int, width: int = 50) -> str:
         """Create ASCII progress bar"""
         if total == 0:
             percentage = 0
         else:
-            percentage = min(current / total, 1.0)
+            percentage = min(max(current / total, 0.0), 1.0)
         
         filled_width = int(width * percentage)
-        bar = '█' * filled_width + '░' * (width - filled_width)
+        if width <= _BAR_WIDTH:
+            bar = _BAR_FULL[:filled_width] + _BAR_EMPTY[:width - filled_width]
+        else:
+            bar = '█' * filled_width + '░' * (width - filled_width)
         
         return f"[{bar}] {percentage * 100:.1f}%"
     
     @staticmethod
     def format_table_row(columns: list, widths: list) -> str:
         """Format table row with proper column alignment"""
-        formatted_columns = []
+        return Formatters.format_table_rows([columns], widths)[0]
+    
+    @staticmethod
+    def format_table_rows(rows: List[list], widths: list,
+                          numeric_mask: Optional[Tuple[bool, ...]] = None) -> List[str]:
+        """Format rows sharing one schema; alignment is decided once per column"""
+        if not rows:
+            return []
         
-        for i, (column, width) in enumerate(zip(columns, widths)):
-            column_str = str(column)
-            if len(column_str) > width:
-                column_str = column_str[:width-3] + '...'
-            
-            # Right-align numbers, left-align text
-            if isinstance(column, (int, float)):
-                formatted_columns.append(column_str.rjust(width))
-            else:
-                formatted_columns.append(column_str.ljust(width))
+        # Right-align numbers, left-align text
+        if numeric_mask is None:
+            numeric_mask = tuple(isinstance(column, (int, float)) for column in rows[0])
+        layout = tuple(zip(widths, numeric_mask))
         
-        return ' | '.join(formatted_columns)
+        formatted_rows = []
+        for row in rows:
+            formatted_columns = []
+            for column_str, (width, numeric) in zip(map(str, row), layout):
+                if len(column_str) > width:
+                    column_str = column_str[:width-3] + '...'
+                formatted_columns.append(column_str.rjust(width) if numeric else column_str.ljust(width))
+            formatted_rows.append(' | '.join(formatted_columns))
+        
+        return formatted_rows
     
     @staticmethod
     def format_json_pretty(data: Dict[str, Any]) -> str:
         """Format JSON data for pretty printing"""
+        if orjson is not None:
+            try:
+                # Passing datetimes through to str() keeps the stdlib output format
+                return orjson.dumps(
+                    data, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                ).decode('utf-8')
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the stdlib encoder handles those
+        
         try:
             return json.dumps(data, indent=2, ensure_ascii=False, default=str)
         except Exception:
             return str(data)
     
     @staticmethod
-    def format_file_age(modified_time: Union[datetime, float]) -> str:
-        """Format file age in human readable format"""
+    def format_file_age(modified_time: Union[datetime, float], now: Optional[datetime] = None) -> str:
+        """Format file age in human readable format
+        
+        Batch callers can pass one ``now`` for every file instead of reading the clock per call.
+        """
         try:
             if isinstance(modified_time, float):
-                modified_dt = datetime.fromtimestamp(modified_time)
+                # Epoch arithmetic; no datetime objects needed for the numeric part
+                now_ts = now.timestamp() if now is not None else time.time()
+                days, seconds = divmod(int((now_ts - modified_time) // 1), 86400)
             else:
-                modified_dt = modified_time
+                age = (now or datetime.now()) - modified_time
+                days, seconds = age.days, age.seconds
             
-            age = datetime.now() - modified_dt
-            
-            if age.days > 365:
-                years = age.days // 365
-                return f"{years} year{'s' if years > 1 else ''} ago"
-            elif age.days > 30:
-                months = age.days // 30
-                return f"{months} month{'s' if months > 1 else ''} ago"
-            elif age.days > 0:
-                return f"{age.days} day{'s' if age.days > 1 else ''} ago"
-            elif age.seconds > 3600:
-                hours = age.seconds // 3600
-                return f"{hours} hour{'s' if hours > 1 else ''} ago"
-            elif age.seconds > 60:
-                minutes = age.seconds // 60
-                return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-            else:
-                return "Just now"
+            # Seconds only matter within the first day; dropping them keeps the cache small
+            return _age_label(days, seconds if days <= 0 else 0)
                 
         except Exception:
             return "Unknown"
@@ -159,16 +244,17 @@ class Formatters:
             # Path too simple to truncate meaningfully
             return path[:max_length-3] + '...'
         
-        # Keep filename and work backwards
-        result = parts[-1]
-        remaining_length = max_length - len(result) - 3  # Reserve space for '...'
+        # Keep filename and work backwards; collect parts and join once
+        kept = deque([parts[-1]])
+        cur_len = len(parts[-1])
+        remaining_length = max_length - 4  # Reserve space for '.../'
         
         for i in range(len(parts) - 2, -1, -1):
-            part_with_sep = '/' + parts[i] if i > 0 else parts[i]
-            if len(result) + len(part_with_sep) <= remaining_length:
-                result = part_with_sep + '/' + result
+            if cur_len + len(parts[i]) + 1 <= remaining_length:
+                kept.appendleft(parts[i])
+                cur_len += len(parts[i]) + 1
             else:
-                result = '...' + result
+                kept.appendleft('...')
                 break
         
-        return result
\ No newline at end of file
+        return '/'.join(kept)
\ No newline at end of file
@@ -3,19 +3,52 @@ Cleaner API endpoints for web interface
 """
 
 import asyncio
+import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from modules.appdata_cleaner import AppDataCleaner
+from modules.temp_cleaner import TempCleaner
+from modules.duplicate_finder import DuplicateFinder
+from utils.backup_manager import BackupManager
+from utils.formatters import now_iso
 
 logger = logging.getLogger(__name__)
 
+# Deletions are syscall-bound, so threads overlap their latency despite the GIL
+MAX_DELETE_WORKERS = 32
+
+# Status text is only refreshed every this many deletions (must be a power of two)
+STATUS_MESSAGE_INTERVAL = 64
+MSG_DELETED = "Deleted {}".format
+
+def _try_unlink(path: str) -> Tuple[bool, Optional[Exception]]:
+    """Delete one file; (False, None) means it was already gone"""
+    try:
+        os.unlink(path)
+        return True, None
+    except FileNotFoundError:
+        return False, None
+    except Exception as e:
+        return False, e
+
 class CleanerAPI:
     """API for cleaning operations"""
     
-    def __init__(self, cleaner_engine, progress_tracker):
+    def __init__(self, cleaner_engine, progress_tracker, system_api=None):
         self.cleaner_engine = cleaner_engine
         self.progress_tracker = progress_tracker
+        self.system_api = system_api
+        self._backup_manager: Optional[BackupManager] = None
+    
+    @property
+    def backup_manager(self) -> BackupManager:
+        """Backup manager shared across operations, created on first use"""
+        if self._backup_manager is None:
+            self._backup_manager = BackupManager(self.cleaner_engine.settings)
+        return self._backup_manager
     
     def clean_files(self, operation_id: str, file_paths: List[str], create_backup: bool = True) -> Dict[str, Any]:
         """Clean specified files"""
@@ -36,27 +69,28 @@ class CleanerAPI:
                 'backup_created': False
             }
             
-            # Create file info objects
+            # Create file info objects; one stat per path doubles as the existence check
             file_objects = []
             for file_path in file_paths:
                 try:
-                    path_obj = Path(file_path)
-                    if path_obj.exists():
-                        stat_info = path_obj.stat()
-                        file_objects.append({
-                            'path': file_path,
-                            'size': stat_info.st_size,
-                            'name': path_obj.name
-                        })
+                    file_path = os.fspath(file_path)
+                    stat_info = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     logger.warning(f"Could not process file {file_path}: {e}")
+                    continue
+                
+                file_objects.append({
+                    'path': file_path,
+                    'size': stat_info.st_size,
+                    'name': os.path.basename(file_path)
+                })
             
             # Create backup if requested
             if create_backup and file_objects:
                 try:
-                    from utils.backup_manager import BackupManager
-                    backup_manager = BackupManager(self.cleaner_engine.settings)
-                    backup_path = backup_manager.create_backup(
+                    backup_path = self.backup_manager.create_backup(
                         [f['path'] for f in file_objects], 
                         operation_id
                     )
@@ -67,35 +101,46 @@ class CleanerAPI:
                     logger.error(f"Backup creation failed: {e}")
                     results['errors'].append(f"Backup failed: {str(e)}")
             
-            # Clean files
-            for i, file_info in enumerate(file_objects):
-                try:
-                    file_path = Path(file_info['path'])
+            # Clean files (only after the backup above has finished)
+            if file_objects:
+                workers = min(MAX_DELETE_WORKERS, len(file_objects))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(_try_unlink, file_info['path']): file_info
+                        for file_info in file_objects
+                    }
                     
-                    if file_path.exists():
-                        file_size = file_info['size']
-                        file_path.unlink()
+                    # Results are tallied here on the calling thread, so no lock is needed
+                    for done, future in enumerate(as_completed(futures), 1):
+                        file_info = futures[future]
+                        deleted, error = future.result()
                         
-                        results['files_deleted'] += 1
-                        results['bytes_freed'] += file_size
-                    
-                    results['files_processed'] += 1
-                    
-                    self.progress_tracker.update_progress(
-                        operation_id, i + 1,
-                        current_item=file_info['name'],
-                        status_message=f"Deleted {file_info['name']}"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Failed to delete {file_info['path']}: {e}")
-                    results['files_failed'] += 1
-                    results['errors'].append(f"Failed to delete {file_info['name']}: {str(e)}")
+                        if error is not None:
+                            logger.error(f"Failed to delete {file_info['path']}: {error}")
+                            results['files_failed'] += 1
+                            results['errors'].append(f"Failed to delete {file_info['name']}: {str(error)}")
+                            continue
+                        
+                        if deleted:
+                            results['files_deleted'] += 1
+                            results['bytes_freed'] += file_info['size']
+                        
+                        results['files_processed'] += 1
+                        
+                        # An empty message leaves the previous status text in place
+                        refresh = (done & (STATUS_MESSAGE_INTERVAL - 1)) == 1
+                        self.progress_tracker.update_progress(
+                            operation_id, done,
+                            current_item=file_info['name'],
+                            status_message=MSG_DELETED(file_info['name']) if refresh else ""
+                        )
             
             self.progress_tracker.complete_operation(operation_id, True)
+            if results['files_deleted']:
+                self._invalidate_system_stats()
             
             results['success'] = results['files_failed'] == 0
-            results['timestamp'] = datetime.now().isoformat()
+            results['timestamp'] = now_iso()
             
             return results
             
@@ -104,11 +149,15 @@ class CleanerAPI:
             self.progress_tracker.complete_operation(operation_id, False)
             return {'error': str(e)}
     
+    def _invalidate_system_stats(self):
+        """Let the dashboard recompute disk and AppData figures after a clean"""
+        if self.system_api is not None:
+            self.system_api.invalidate_appdata()
+    
     def clean_appdata(self, operation_id: str, categories: List[str] = None, 
                      include_potentially_safe: bool = False) -> Dict[str, Any]:
         """Clean AppData files"""
         try:
-            from modules.appdata_cleaner import AppDataCleaner
             appdata_cleaner = AppDataCleaner(self.progress_tracker)
             
             self.progress_tracker.start_operation(operation_id)
@@ -122,6 +171,7 @@ class CleanerAPI:
             )
             
             self.progress_tracker.complete_operation(operation_id, True)
+            self._invalidate_system_stats()
             
             return {
                 'operation_id': operation_id,
@@ -130,7 +180,7 @@ class CleanerAPI:
                 'bytes_freed': clean_results['bytes_freed'],
                 'directories_removed': clean_results['directories_removed'],
                 'failed_deletions': clean_results['failed_deletions'],
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -142,7 +192,6 @@ class CleanerAPI:
                         categories: List[str] = None) -> Dict[str, Any]:
         """Clean temporary files"""
         try:
-            from modules.temp_cleaner import TempCleaner
             temp_cleaner = TempCleaner(self.progress_tracker)
             
             self.progress_tracker.start_operation(operation_id)
@@ -157,6 +206,7 @@ class CleanerAPI:
             clean_results = temp_cleaner.clean_temp_files(categorized_files, categories)
             
             self.progress_tracker.complete_operation(operation_id, True)
+            self._invalidate_system_stats()
             
             return {
                 'operation_id': operation_id,
@@ -167,7 +217,7 @@ class CleanerAPI:
                 'bytes_freed': clean_results['bytes_freed'],
                 'directories_removed': clean_results['directories_removed'],
                 'failed_deletions': clean_results['failed_deletions'],
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -179,19 +229,21 @@ class CleanerAPI:
                          keep_strategy: str = 'newest') -> Dict[str, Any]:
         """Remove duplicate files"""
         try:
-            from modules.duplicate_finder import DuplicateFinder
             duplicate_finder = DuplicateFinder(self.progress_tracker)
             
             self.progress_tracker.start_operation(operation_id)
             
             # Find duplicates
-            path_objects = [Path(p) for p in scan_paths if Path(p).exists()]
+            # Check existence on the raw strings and only wrap the survivors in Path
+            exists = os.path.exists
+            path_objects = list(map(Path, [p for p in scan_paths if exists(p)]))
             duplicates = duplicate_finder.find_duplicates(path_objects)
             
             # Remove duplicates
             remove_results = duplicate_finder.remove_duplicates(duplicates, keep_strategy)
             
             self.progress_tracker.complete_operation(operation_id, True)
+            self._invalidate_system_stats()
             
             return {
                 'operation_id': operation_id,
@@ -201,7 +253,7 @@ class CleanerAPI:
                 'files_removed': remove_results['files_removed'],
                 'bytes_freed': remove_results['bytes_freed'],
                 'failed_removals': remove_results['failed_removals'],
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -3,45 +3,102 @@ Scanner API endpoints for web interface
 """
 
 import asyncio
+import os
+import time
+from array import array
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import logging
-from datetime import datetime
+from collections import Counter, deque
+from functools import partial
 
-from core.scanner import FileScanner
+try:
+    import numpy as np  # Optional vectorized age bucketing
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional JIT for the numeric scan reductions
+except ImportError:
+    njit = None
+
+from config.settings import Settings
+from core.scanner import FileScanner, ScanBatch
 from core.analyzer import FileAnalyzer
 from modules.appdata_cleaner import AppDataCleaner
 from modules.temp_cleaner import TempCleaner
 from modules.duplicate_finder import DuplicateFinder
+from utils.formatters import Formatters, now_iso
+from web.utils import expandvars
 
 logger = logging.getLogger(__name__)
 
+# Below this many files the stdlib reductions finish before a JIT call pays off
+JIT_MIN_FILES = 50_000
+
+# Below this many files building NumPy views costs more than the Python age passes
+NUMPY_MIN_FILES = 10_000
+
+# Upper bounds (inclusive) of the '0-7_days' and '7-30_days' age groups
+AGE_BUCKET_EDGES = (7.0, 30.0)
+
+# Files classified between progress updates during a full scan
+ANALYZE_CHUNK_SIZE = 1000
+
+if njit is not None:
+    @njit(cache=True)
+    def _aggregate_numeric(sizes, safety_levels, ages, cleanable):
+        """Single native pass over the numeric ScanBatch columns"""
+        cleanable_count = 0
+        cleanable_size = 0
+        recent = 0
+        within_month = 0
+        safety_hist = np.zeros(11, np.int64)
+        for i in range(sizes.shape[0]):
+            if cleanable[i]:
+                cleanable_count += 1
+                cleanable_size += sizes[i]
+            if ages[i] <= 7:
+                recent += 1
+            if ages[i] <= 30:
+                within_month += 1
+            level = safety_levels[i]
+            if 0 <= level < 11:
+                safety_hist[level] += 1
+        return cleanable_count, cleanable_size, recent, within_month, safety_hist
+else:
+    _aggregate_numeric = None
+
+def _suffix(name: str) -> str:
+    """File extension with Path.suffix semantics, without building a Path"""
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
 class ScannerAPI:
     """API for scanning operations"""
     
     def __init__(self, progress_tracker):
         self.progress_tracker = progress_tracker
+        self._settings = Settings()
         self.scanner = None
         self.analyzer = None
     
-    def _initialize_components(self, settings):
-        """Initialize scanner components"""
+    def _initialize_components(self):
+        """Initialize scanner components on first use"""
         if not self.scanner:
-            self.scanner = FileScanner(settings)
+            self.scanner = FileScanner(self._settings)
         if not self.analyzer:
-            self.analyzer = FileAnalyzer(settings)
+            self.analyzer = FileAnalyzer(self._settings)
     
     def quick_scan(self, operation_id: str) -> Dict[str, Any]:
         """Perform quick scan of common locations"""
         try:
-            from config.settings import Settings
-            settings = Settings()
-            self._initialize_components(settings)
+            self._initialize_components()
             
             # Quick scan paths (most common cleanup locations)
             quick_paths = [
-                os.path.expandvars('%TEMP%'),
-                os.path.expandvars('%LOCALAPPDATA%\\Temp'),
+                expandvars('%TEMP%'),
+                expandvars('%LOCALAPPDATA%\\Temp'),
                 'C:\\Windows\\Temp'
             ]
             
@@ -51,7 +108,7 @@ class ScannerAPI:
             
             self.progress_tracker.start_operation(operation_id)
             
-            all_files = []
+            all_files = ScanBatch()
             for i, path in enumerate(quick_paths):
                 try:
                     path_obj = Path(path)
@@ -63,7 +120,7 @@ class ScannerAPI:
                     self.progress_tracker.update_progress(
                         operation_id, i + 1,
                         current_item=path,
-                        status_message=f"Scanned {len(files)} files"
+                        status_message=f"Scanned {Formatters.format_file_count(len(files))}"
                     )
                     
                 except Exception as e:
@@ -83,7 +140,7 @@ class ScannerAPI:
                 'potential_savings_mb': round(results['cleanable_size'] / (1024**2), 2),
                 'categories': results['categories'],
                 'scan_paths': quick_paths,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -94,9 +151,7 @@ class ScannerAPI:
     def full_scan(self, operation_id: str, scan_paths: List[str]) -> Dict[str, Any]:
         """Perform comprehensive system scan"""
         try:
-            from config.settings import Settings
-            settings = Settings()
-            self._initialize_components(settings)
+            self._initialize_components()
             
             progress = self.progress_tracker.create_operation(
                 operation_id, "Full System Scan", len(scan_paths)
@@ -104,33 +159,44 @@ class ScannerAPI:
             
             self.progress_tracker.start_operation(operation_id)
             
-            all_files = []
-            scan_stats = {'paths_scanned': 0, 'paths_failed': 0}
-            
-            for i, path in enumerate(scan_paths):
-                try:
-                    path_obj = Path(path)
-                    if path_obj.exists():
-                        # Full scan - no limits
-                        files = asyncio.run(self.scanner.scan_path(path))
+            all_files = ScanBatch()
+            existing_paths = [path for path in scan_paths if Path(path).exists()]
+            scan_stats = {'paths_scanned': 0, 'paths_failed': len(scan_paths) - len(existing_paths)}
+            completed = scan_stats['paths_failed']
+            
+            def on_path_done(path: str, task: asyncio.Task):
+                nonlocal completed
+                completed += 1
+                found = 0 if task.cancelled() or task.exception() else len(task.result())
+                self.progress_tracker.update_progress(
+                    operation_id, completed,
+                    current_item=path,
+                    status_message=f"Found {Formatters.format_file_count(found)}"
+                )
+            
+            # One event loop for the whole scan: paths interleave and the analysis reuses it
+            loop = asyncio.new_event_loop()
+            try:
+                tasks = []
+                for path in existing_paths:
+                    task = loop.create_task(self.scanner.scan_path_batch(path))
+                    task.add_done_callback(partial(on_path_done, path))
+                    tasks.append(task)
+                
+                per_path = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                for path, files in zip(existing_paths, per_path):
+                    if isinstance(files, BaseException):
+                        logger.error(f"Error scanning {path}: {files}")
+                        scan_stats['paths_failed'] += 1
+                    else:
                         all_files.extend(files)
                         scan_stats['paths_scanned'] += 1
-                    else:
-                        scan_stats['paths_failed'] += 1
-                    
-                    self.progress_tracker.update_progress(
-                        operation_id, i + 1,
-                        current_item=path,
-                        status_message=f"Found {len(files)} files"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error scanning {path}: {e}")
-                    scan_stats['paths_failed'] += 1
-                    continue
+                
+                # Full analysis
+                analyzed_files = loop.run_until_complete(self._analyze_in_chunks(operation_id, all_files))
+            finally:
+                loop.close()
             
-            # Full analysis
-            analyzed_files = asyncio.run(self.analyzer.analyze_files(all_files))
             results = self._analyze_scan_results(analyzed_files)
             
             self.progress_tracker.complete_operation(operation_id, True)
@@ -146,7 +212,7 @@ class ScannerAPI:
                 'safety_breakdown': results['safety_levels'],
                 'scan_paths': scan_paths,
                 'scan_stats': scan_stats,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso(),
                 'files': analyzed_files[:100]  # First 100 files for preview
             }
             
@@ -155,84 +221,122 @@ class ScannerAPI:
             self.progress_tracker.complete_operation(operation_id, False)
             return {'error': str(e)}
     
-    def _quick_scan_path(self, path: Path, max_files: int = 500) -> List[Dict]:
-        """Quick scan of a path with limits"""
-        files = []
+    async def _analyze_in_chunks(self, operation_id: str, batch: ScanBatch) -> ScanBatch:
+        """Classify a batch in place, chunk by chunk, reporting progress in between"""
+        total = len(batch)
+        for start in range(0, total, ANALYZE_CHUNK_SIZE):
+            stop = min(start + ANALYZE_CHUNK_SIZE, total)
+            await self.analyzer.analyze_batch(batch, start, stop)
+            self.progress_tracker.update_progress(
+                operation_id, status_message=f"Analyzed {stop:,} of {total:,} files"
+            )
+            await asyncio.sleep(0)
+        
+        return batch
+    
+    def _quick_scan_path(self, path: Path, max_files: int = 500) -> ScanBatch:
+        """Quick scan of a path with limits, collected straight into columns"""
+        paths = []
+        extensions = []
+        sizes = array('q')
+        mtimes = array('d')
         file_count = 0
         
         try:
-            for item in path.rglob('*'):
-                if file_count >= max_files:
-                    break
-                
+            # Iterative scandir DFS: DirEntry carries the file type (and on Windows the stat)
+            pending_dirs = deque([os.fspath(path)])
+            while pending_dirs and file_count < max_files:
                 try:
-                    if item.is_file():
-                        stat_info = item.stat()
-                        
-                        files.append({
-                            'path': str(item),
-                            'name': item.name,
-                            'size': stat_info.st_size,
-                            'extension': item.suffix.lower(),
-                            'modified_time': stat_info.st_mtime,
-                            'age_days': (datetime.now().timestamp() - stat_info.st_mtime) / (24 * 3600)
-                        })
-                        
-                        file_count += 1
-                        
-                except (PermissionError, OSError):
+                    entries = os.scandir(pending_dirs.pop())
+                except OSError:
                     continue
+                
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            
+                            stat_info = entry.stat(follow_symlinks=False)
+                            paths.append(entry.path)
+                            extensions.append(_suffix(entry.name).lower())
+                            sizes.append(stat_info.st_size)
+                            mtimes.append(stat_info.st_mtime)
+                            
+                            file_count += 1
+                            if file_count >= max_files:
+                                break
+                            
+                        except OSError:
+                            continue
                     
         except Exception as e:
             logger.error(f"Error in quick scan of {path}: {e}")
         
-        return files
+        # One clock read per scan; ages are derived from the mtime column in one pass
+        now_ts = time.time()
+        inv_day = 1.0 / 86400.0
+        return ScanBatch(
+            paths=paths,
+            extensions=extensions,
+            sizes=sizes,
+            mtimes=mtimes,
+            ages=array('d', [(now_ts - mtime) * inv_day for mtime in mtimes]),
+            categories=['unknown'] * file_count,
+            safety_levels=array('b', [5]) * file_count,
+            cleanable=array('b', bytes(file_count))
+        )
     
-    def _analyze_scan_results(self, files: List[Dict]) -> Dict[str, Any]:
+    def _analyze_scan_results(self, files: Union[List[Dict], ScanBatch]) -> Dict[str, Any]:
         """Analyze scan results for web display"""
-        results = {
-            'cleanable_count': 0,
-            'cleanable_size': 0,
-            'categories': {},
-            'safety_levels': {},
-            'extensions': {},
-            'age_groups': {'0-7_days': 0, '7-30_days': 0, '30+_days': 0}
-        }
+        batch = files if isinstance(files, ScanBatch) else ScanBatch.from_files(files)
         
-        for file_info in files:
-            # Count cleanable files
-            if file_info.get('cleanable', False):
-                results['cleanable_count'] += 1
-                results['cleanable_size'] += file_info.get('size', 0)
-            
-            # Count by category
-            category = file_info.get('category', 'unknown')
-            results['categories'][category] = results['categories'].get(category, 0) + 1
-            
-            # Count by safety level
-            safety = file_info.get('safety_level', 5)
-            results['safety_levels'][str(safety)] = results['safety_levels'].get(str(safety), 0) + 1
-            
-            # Count by extension
-            ext = file_info.get('extension', '')
-            if ext:
-                results['extensions'][ext] = results['extensions'].get(ext, 0) + 1
-            
-            # Age groups
-            age = file_info.get('age_days', 0)
-            if age <= 7:
-                results['age_groups']['0-7_days'] += 1
-            elif age <= 30:
-                results['age_groups']['7-30_days'] += 1
-            else:
-                results['age_groups']['30+_days'] += 1
+        # Counter consumes the columns in C instead of per-key dict.get() updates
+        categories = Counter(batch.categories)
+        extensions = Counter(batch.extensions)
+        extensions.pop('', None)
         
-        # Sort extensions by count
-        results['extensions'] = dict(
-            sorted(results['extensions'].items(), key=lambda x: x[1], reverse=True)[:10]
-        )
+        ages = batch.ages
+        if _aggregate_numeric is not None and len(batch) >= JIT_MIN_FILES:
+            # The array columns expose their buffers, so NumPy views them without copying
+            cleanable_count, cleanable_size, recent, within_month, safety_hist = _aggregate_numeric(
+                np.frombuffer(batch.sizes, dtype=np.int64),
+                np.frombuffer(batch.safety_levels, dtype=np.int8),
+                np.frombuffer(ages, dtype=np.float64),
+                np.frombuffer(batch.cleanable, dtype=np.int8)
+            )
+            cleanable_count, cleanable_size = int(cleanable_count), int(cleanable_size)
+            safety_levels = {str(level): int(count) for level, count in enumerate(safety_hist) if count}
+        else:
+            cleanable_count = sum(batch.cleanable)
+            cleanable_size = sum(batch.cleanable_sizes())
+            if np is not None and len(ages) >= NUMPY_MIN_FILES:
+                # side='left' puts an age equal to an edge into the lower bucket
+                buckets = np.searchsorted(AGE_BUCKET_EDGES, np.frombuffer(ages, dtype=np.float64), side='left')
+                bucket_counts = np.bincount(buckets, minlength=3)
+                recent = int(bucket_counts[0])
+                within_month = recent + int(bucket_counts[1])
+            else:
+                recent = sum(1 for age in ages if age <= 7)
+                within_month = sum(1 for age in ages if age <= 30)
+            safety_levels = {str(level): count for level, count in Counter(batch.safety_levels).items()}
         
-        return results
+        return {
+            'cleanable_count': cleanable_count,
+            'cleanable_size': cleanable_size,
+            'categories': dict(categories),
+            'safety_levels': safety_levels,
+            # Sort extensions by count
+            'extensions': dict(extensions.most_common(10)),
+            'age_groups': {
+                '0-7_days': recent,
+                '7-30_days': within_month - recent,
+                '30+_days': len(ages) - within_month
+            }
+        }
     
     def scan_appdata_only(self, operation_id: str) -> Dict[str, Any]:
         """Scan only AppData directories"""
@@ -253,7 +357,7 @@ class ScannerAPI:
                     category: len(files) for category, files in categorized_files.items()
                 },
                 'size_analysis': size_analysis,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -281,7 +385,7 @@ class ScannerAPI:
                     category: len(files) for category, files in categorized_files.items()
                 },
                 'analysis': analysis,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
@@ -296,7 +400,9 @@ class ScannerAPI:
             
             self.progress_tracker.start_operation(operation_id)
             
-            path_objects = [Path(p) for p in scan_paths if Path(p).exists()]
+            # Check existence on the raw strings and only wrap the survivors in Path
+            exists = os.path.exists
+            path_objects = list(map(Path, [p for p in scan_paths if exists(p)]))
             duplicates = duplicate_finder.find_duplicates(path_objects)
             analysis = duplicate_finder.get_duplicate_analysis(duplicates)
             
@@ -309,7 +415,7 @@ class ScannerAPI:
                 'total_duplicates': analysis.get('total_duplicates', 0),
                 'wasted_space_mb': round(analysis.get('total_wasted_space', 0) / (1024**2), 2),
                 'analysis': analysis,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
         except Exception as e:
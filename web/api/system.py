@@ -4,139 +4,276 @@ System API endpoints for web interface
 
 import psutil
 import os
+import time
+import heapq
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from web.utils import expandvars
+
 logger = logging.getLogger(__name__)
 
+_MB = 1 << 20
+_GB = 1 << 30
+
+# Seconds the advisory endpoints reuse a result; dashboards poll every few seconds
+PROCESSES_TTL = 5
+VOLATILE_TTL = 2
+# Disk and AppData figures are also invalidated explicitly after a clean
+SEMISTATIC_TTL = 300
+CLEANUP_POTENTIAL_TTL = 60
+DISK_USAGE_TTL = 60
+
+# Upper bound on the temp files counted for the cleanup estimate
+TEMP_FILE_COUNT_LIMIT = 1000
+
+# Directory size sampling stops early once it has seen this much data or time
+SAMPLE_TARGET_BYTES = 256 * _MB
+SAMPLE_TIME_BUDGET = 0.2  # seconds
+
+# The sampling deadline is only checked every this many entries (must be a power of two)
+DEADLINE_CHECK_INTERVAL = 16
+
+# Processes reported by get_running_processes
+TOP_PROCESS_COUNT = 20
+
+# Prime the process-wide CPU counter once, so later non-blocking samples measure the
+# time since the previous request; priming per instance would reset that baseline
+psutil.cpu_percent(interval=None)
+
 class SystemAPI:
     """API for system information and monitoring"""
     
     def __init__(self):
         self.stats_cache = {}
-        self.cache_timeout = 30  # seconds
+        self._cache_versions = {}
+        self._access_cache = {}
+        self._etag_epoch = int(time.time())  # Keeps validators from earlier runs from matching
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Environment-derived locations are fixed for the process lifetime
+        self._appdata_paths = {
+            name: Path(expandvars(path)) for name, path in (
+                ('local', '%LOCALAPPDATA%'),
+                ('roaming', '%APPDATA%'),
+                ('temp', '%TEMP%')
+            )
+        }
+        self._temp_paths = [
+            Path(expandvars(path)) for path in (
+                '%TEMP%',
+                '%LOCALAPPDATA%\\Temp',
+                'C:\\Windows\\Temp'
+            )
+        ]
+    
+    def _cached(self, key, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s result, reusing it for ttl seconds under key"""
+        now = time.monotonic()
+        entry = self.stats_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        value = fn()
+        self.stats_cache[key] = (now, value)
+        self._cache_versions[key] = self._cache_versions.get(key, 0) + 1
+        return value
+    
+    def system_info_etag(self) -> str:
+        """Validator for the current get_system_info payload, for conditional GETs"""
+        return (f"sys-{self._etag_epoch}-{self._cache_versions.get('system_volatile', 0)}"
+                f"-{self._cache_versions.get('system_semistatic', 0)}")
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get comprehensive system information"""
         try:
-            # Check cache
-            now = datetime.now()
-            if 'system_info' in self.stats_cache:
-                cached_time, cached_data = self.stats_cache['system_info']
-                if (now - cached_time).seconds < self.cache_timeout:
-                    return cached_data
+            volatile = self._cached('system_volatile', VOLATILE_TTL, self._get_volatile)
+            semistatic = self._cached('system_semistatic', SEMISTATIC_TTL, self._get_semistatic)
             
-            # Gather system info
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('C:\\')
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = now - boot_time
-            
-            system_info = {
-                'timestamp': now.isoformat(),
-                'system': {
-                    'platform': os.name,
-                    'hostname': os.environ.get('COMPUTERNAME', 'Unknown'),
-                    'username': os.environ.get('USERNAME', 'Unknown'),
-                    'uptime_hours': round(uptime.total_seconds() / 3600, 1)
-                },
-                'memory': {
-                    'total_gb': round(memory.total / (1024**3), 2),
-                    'available_gb': round(memory.available / (1024**3), 2),
-                    'used_gb': round(memory.used / (1024**3), 2),
-                    'percentage': memory.percent
-                },
-                'disk': {
-                    'total_gb': round(disk.total / (1024**3), 2),
-                    'free_gb': round(disk.free / (1024**3), 2),
-                    'used_gb': round(disk.used / (1024**3), 2),
-                    'percentage': round((disk.used / disk.total) * 100, 1)
-                },
-                'cpu': {
-                    'percentage': cpu_percent,
-                    'count': psutil.cpu_count()
-                },
-                'appdata_paths': self._get_appdata_info()
+            return {
+                'timestamp': volatile['timestamp'],
+                'system': volatile['system'],
+                'memory': volatile['memory'],
+                'disk': semistatic['disk'],
+                'cpu': volatile['cpu'],
+                'appdata_paths': semistatic['appdata_paths']
             }
-            
-            # Cache the result
-            self.stats_cache['system_info'] = (now, system_info)
-            
-            return system_info
-            
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
             return {'error': str(e)}
     
+    def invalidate_appdata(self):
+        """Drop cached disk and AppData figures after files were cleaned"""
+        self.stats_cache.pop('system_semistatic', None)
+        self.stats_cache.pop('cleanup_potential', None)
+    
+    def _get_volatile(self) -> Dict[str, Any]:
+        """CPU, memory and uptime; wall-clock time is only read for the payload"""
+        now = datetime.now()
+        memory = psutil.virtual_memory()
+        mem_total, mem_available, mem_used = memory.total, memory.available, memory.used
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        uptime = now - boot_time
+        
+        return {
+            'timestamp': now.isoformat(),
+            'system': {
+                'platform': os.name,
+                'hostname': os.environ.get('COMPUTERNAME', 'Unknown'),
+                'username': os.environ.get('USERNAME', 'Unknown'),
+                'uptime_hours': round(uptime.total_seconds() / 3600, 1)
+            },
+            'memory': {
+                'total_gb': round(mem_total / _GB, 2),
+                'available_gb': round(mem_available / _GB, 2),
+                'used_gb': round(mem_used / _GB, 2),
+                'percentage': memory.percent
+            },
+            'cpu': {
+                'percentage': cpu_percent,
+                'count': psutil.cpu_count()
+            }
+        }
+    
+    def _get_semistatic(self) -> Dict[str, Any]:
+        """Disk and AppData figures, which only move when files are written or cleaned"""
+        disk = psutil.disk_usage('C:\\')
+        disk_total, disk_free, disk_used = disk.total, disk.free, disk.used
+        
+        return {
+            'disk': {
+                'total_gb': round(disk_total / _GB, 2),
+                'free_gb': round(disk_free / _GB, 2),
+                'used_gb': round(disk_used / _GB, 2),
+                'percentage': round((disk_used / disk_total) * 100, 1)
+            },
+            'appdata_paths': self._get_appdata_info()
+        }
+    
     def _get_appdata_info(self) -> Dict[str, Dict]:
         """Get AppData directories information"""
         try:
-            appdata_paths = {
-                'local': os.path.expandvars('%LOCALAPPDATA%'),
-                'roaming': os.path.expandvars('%APPDATA%'),
-                'temp': os.path.expandvars('%TEMP%')
+            # The directories are independent and I/O bound, so list them concurrently
+            futures = {
+                name: self._io_pool.submit(self._get_appdata_path_info, name, path_obj)
+                for name, path_obj in self._appdata_paths.items()
             }
-            
-            appdata_info = {}
-            
-            for name, path in appdata_paths.items():
-                try:
-                    path_obj = Path(path)
-                    if path_obj.exists():
-                        # Get directory size (sample first level only for speed)
-                        size = self._get_directory_sample_size(path_obj)
-                        file_count = len([f for f in path_obj.iterdir() if f.is_file()])
-                        dir_count = len([f for f in path_obj.iterdir() if f.is_dir()])
-                        
-                        appdata_info[name] = {
-                            'path': str(path_obj),
-                            'exists': True,
-                            'accessible': os.access(path_obj, os.R_OK | os.W_OK),
-                            'size_mb': round(size / (1024**2), 2),
-                            'file_count': file_count,
-                            'dir_count': dir_count
-                        }
-                    else:
-                        appdata_info[name] = {
-                            'path': path,
-                            'exists': False,
-                            'accessible': False
-                        }
-                except Exception as e:
-                    logger.debug(f"Error getting info for {name}: {e}")
-                    appdata_info[name] = {
-                        'path': path,
-                        'exists': False,
-                        'accessible': False,
-                        'error': str(e)
-                    }
-            
-            return appdata_info
+            return {name: future.result() for name, future in futures.items()}
             
         except Exception as e:
             logger.error(f"Error getting AppData info: {e}")
             return {}
     
-    def _get_directory_sample_size(self, directory: Path, max_files: int = 100) -> int:
-        """Get sample size of directory (for performance)"""
+    def _get_appdata_path_info(self, name: str, path_obj: Path) -> Dict[str, Any]:
+        """Information for a single AppData directory"""
+        path = str(path_obj)
         try:
-            total_size = 0
-            file_count = 0
-            
-            for item in directory.iterdir():
-                if file_count >= max_files:
+            if path_obj.exists():
+                # Sample size and entry counts come from one first-level scandir pass
+                size, file_count, dir_count = self._get_directory_summary(path_obj)
+                
+                return {
+                    'path': path,
+                    'exists': True,
+                    'accessible': self._is_accessible(path),
+                    'size_mb': round(size / _MB, 2),
+                    'file_count': file_count,
+                    'dir_count': dir_count
+                }
+            else:
+                return {
+                    'path': path,
+                    'exists': False,
+                    'accessible': False
+                }
+        except Exception as e:
+            logger.debug(f"Error getting info for {name}: {e}")
+            return {
+                'path': path,
+                'exists': False,
+                'accessible': False,
+                'error': str(e)
+            }
+    
+    def _is_accessible(self, path: str) -> bool:
+        """Read/write access to path, checked once; AppData ACLs do not change at runtime"""
+        accessible = self._access_cache.get(path)
+        if accessible is None:
+            accessible = self._access_cache[path] = os.access(path, os.R_OK | os.W_OK)
+        return accessible
+    
+    def _get_directory_summary(self, directory: Path, max_files: int = 100,
+                               target_bytes: int = SAMPLE_TARGET_BYTES,
+                               count_limit: Optional[int] = None,
+                               time_budget: float = SAMPLE_TIME_BUDGET) -> Tuple[int, int, int]:
+        """Sample size of the first max_files files (up to target_bytes) plus file and directory counts
+        
+        With count_limit the pass stops once that many files have been counted; it also
+        stops when the time budget runs out, leaving the counts as seen so far.
+        """
+        total_size = 0
+        sampled = 0
+        file_count = 0
+        dir_count = 0
+        deadline = time.monotonic() + time_budget
+        
+        monotonic = time.monotonic
+        
+        with os.scandir(directory) as entries:
+            for seen, entry in enumerate(entries):
+                if not (seen & (DEADLINE_CHECK_INTERVAL - 1)) and monotonic() > deadline:
                     break
-                    
+                
                 try:
-                    if item.is_file():
-                        total_size += item.stat().st_size
+                    if entry.is_file():
+                        if sampled < max_files and total_size < target_bytes and not entry.is_symlink():
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            sampled += 1
                         file_count += 1
-                except (PermissionError, OSError):
+                        if count_limit is not None and file_count >= count_limit:
+                            break
+                    elif entry.is_dir():
+                        dir_count += 1
+                except OSError:
                     continue
+        
+        return total_size, file_count, dir_count
+    
+    def _get_directory_sample_size(self, directory: Path, max_files: int = 100,
+                                   target_bytes: int = SAMPLE_TARGET_BYTES,
+                                   time_budget: float = SAMPLE_TIME_BUDGET) -> int:
+        """Get sample size of directory (for performance)
+        
+        Stops after max_files files, once target_bytes have been seen, or when the
+        time budget runs out, whichever comes first; the figure is only a rough MB estimate.
+        """
+        try:
+            total_size = 0
+            file_count = 0
+            deadline = time.monotonic() + time_budget
+            
+            monotonic = time.monotonic
+            
+            # DirEntry carries the file type (and on Windows the size) from the directory listing
+            with os.scandir(directory) as entries:
+                for seen, entry in enumerate(entries):
+                    if file_count >= max_files or total_size >= target_bytes:
+                        break
+                    if not (seen & (DEADLINE_CHECK_INTERVAL - 1)) and monotonic() > deadline:
+                        break
+                    
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                    except OSError:
+                        continue
             
             return total_size
             
@@ -146,101 +283,121 @@ class SystemAPI:
     def get_cleanup_potential(self) -> Dict[str, Any]:
         """Estimate cleanup potential"""
         try:
-            # Quick estimation based on common temp locations
-            temp_paths = [
-                os.path.expandvars('%TEMP%'),
-                os.path.expandvars('%LOCALAPPDATA%\\Temp'),
-                'C:\\Windows\\Temp'
-            ]
-            
-            total_potential = 0
-            file_count = 0
-            accessible_paths = []
-            
-            for temp_path in temp_paths:
-                try:
-                    path_obj = Path(temp_path)
-                    if path_obj.exists():
-                        size = self._get_directory_sample_size(path_obj)
-                        total_potential += size
-                        accessible_paths.append(temp_path)
-                        
-                        # Count files
-                        for item in path_obj.iterdir():
-                            if item.is_file():
-                                file_count += 1
-                                if file_count >= 1000:  # Limit for performance
-                                    break
-                except Exception:
-                    continue
-            
-            return {
-                'estimated_cleanup_mb': round(total_potential / (1024**2), 2),
-                'estimated_file_count': file_count,
-                'accessible_temp_paths': len(accessible_paths),
-                'paths_checked': accessible_paths
-            }
-            
+            return self._cached('cleanup_potential', CLEANUP_POTENTIAL_TTL, self._estimate_cleanup_potential)
         except Exception as e:
             logger.error(f"Error estimating cleanup potential: {e}")
             return {'error': str(e)}
     
+    def _estimate_cleanup_potential(self) -> Dict[str, Any]:
+        """Sample the temp locations for the cleanup estimate"""
+        # Quick estimation based on common temp locations, sampled concurrently
+        total_potential = 0
+        file_count = 0
+        accessible_paths = []
+        
+        futures = [(path_obj, self._io_pool.submit(self._sample_temp_path, path_obj))
+                   for path_obj in self._temp_paths]
+        for path_obj, future in futures:
+            sample = future.result()
+            if sample is None:
+                continue
+            
+            size, count = sample
+            total_potential += size
+            file_count += count
+            accessible_paths.append(str(path_obj))
+        
+        file_count = min(file_count, TEMP_FILE_COUNT_LIMIT)
+        
+        return {
+            'estimated_cleanup_mb': round(total_potential / _MB, 2),
+            'estimated_file_count': file_count,
+            'accessible_temp_paths': len(accessible_paths),
+            'paths_checked': accessible_paths
+        }
+    
+    def _sample_temp_path(self, path_obj: Path) -> Optional[Tuple[int, int]]:
+        """Sample size and capped file count of one temp location, None if unavailable"""
+        try:
+            if not path_obj.exists():
+                return None
+            
+            # Size sample and capped file count from a single scandir pass
+            size, count, _ = self._get_directory_summary(path_obj, count_limit=TEMP_FILE_COUNT_LIMIT)
+            return size, count
+        except Exception:
+            return None
+    
     def get_running_processes(self) -> List[Dict]:
         """Get list of running processes"""
         try:
-            processes = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'cpu_percent']):
-                try:
-                    if proc.info['memory_percent'] > 1.0:  # Only significant processes
-                        processes.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'memory_percent': round(proc.info['memory_percent'], 2),
-                            'cpu_percent': round(proc.info['cpu_percent'] or 0, 2)
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Sort by memory usage
-            processes.sort(key=lambda x: x['memory_percent'], reverse=True)
-            
-            return processes[:20]  # Top 20 processes
-            
+            return self._cached('processes', PROCESSES_TTL, self._collect_running_processes)
         except Exception as e:
             logger.error(f"Error getting processes: {e}")
             return []
     
+    def _collect_running_processes(self) -> List[Dict]:
+        """Enumerate processes and keep the top 20 by memory"""
+        candidates = []
+        
+        # psutil>=6 dropped the per-process PID-reuse check from process_iter, and it
+        # reuses Process objects between calls, so cpu_percent is relative to the
+        # previous request (0.0 the first time a process is seen)
+        for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'cpu_percent']):
+            try:
+                info = proc.info
+                if info['memory_percent'] > 1.0:  # Only significant processes
+                    candidates.append((info['memory_percent'], info))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        # Top 20 by memory usage; a bounded heap instead of sorting every candidate
+        return [
+            {
+                'pid': info['pid'],
+                'name': info['name'],
+                'memory_percent': round(memory_percent, 2),
+                'cpu_percent': round(info['cpu_percent'] or 0, 2)
+            }
+            for memory_percent, info in heapq.nlargest(TOP_PROCESS_COUNT, candidates, key=itemgetter(0))
+        ]
+    
     def get_disk_usage_by_directory(self, base_path: str = None) -> Dict[str, Dict]:
         """Get disk usage breakdown by directory"""
         try:
             if base_path is None:
-                base_path = os.path.expandvars('%USERPROFILE%')
-            
-            base_path_obj = Path(base_path)
-            if not base_path_obj.exists():
-                return {}
-            
-            directory_sizes = {}
-            
-            for item in base_path_obj.iterdir():
-                if item.is_dir():
-                    try:
-                        size = self._get_directory_sample_size(item, max_files=50)
-                        if size > 0:
-                            directory_sizes[item.name] = {
-                                'size_mb': round(size / (1024**2), 2),
-                                'path': str(item)
-                            }
-                    except Exception:
-                        continue
-            
-            # Sort by size
-            sorted_dirs = dict(sorted(directory_sizes.items(), 
-                                    key=lambda x: x[1]['size_mb'], reverse=True))
+                base_path = expandvars('%USERPROFILE%')
             
-            return sorted_dirs
+            return self._cached(
+                ('disk_usage', base_path), DISK_USAGE_TTL,
+                lambda: self._collect_disk_usage(Path(base_path))
+            )
             
         except Exception as e:
             logger.error(f"Error getting disk usage: {e}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    def _collect_disk_usage(self, base_path_obj: Path) -> Dict[str, Dict]:
+        """Sample the size of each first-level directory under base_path_obj"""
+        if not base_path_obj.exists():
+            return {}
+        
+        directory_sizes = {}
+        
+        for item in base_path_obj.iterdir():
+            if item.is_dir():
+                try:
+                    size = self._get_directory_sample_size(item, max_files=50)
+                    if size > 0:
+                        directory_sizes[item.name] = {
+                            'size_mb': round(size / _MB, 2),
+                            'path': str(item)
+                        }
+                except Exception:
+                    continue
+        
+        # Sort by size
+        sorted_dirs = dict(sorted(directory_sizes.items(), 
+                                key=lambda x: x[1]['size_mb'], reverse=True))
+        
+        return sorted_dirs
\ No newline at end of file
@@ -2,6 +2,12 @@
 Flask web application for Ultra-Turbo AppData Cleaner
 """
 
+# eventlet has to patch the stdlib before anything imports sockets or threading
+import os
+if os.environ.get('SOCKETIO_ASYNC_MODE') == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 # Fix import path issues
 import sys
 from pathlib import Path
@@ -11,18 +17,64 @@ project_root = Path(__file__).resolve().parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
-import os
 from datetime import datetime
 import threading
+import time
+import queue
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 
+try:
+    import orjson  # Optional C encoder for API responses
+except ImportError:
+    orjson = None
+
+from web.config import WebConfig
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses with orjson, keeping Flask's handling of non-native values"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            # Flask sorts keys by default; keep responses byte-identical in key order
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            # Dates go through Flask's default hook so their format is unchanged
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+class OrjsonSocketIOCodec:
+    """json-module stand-in so Socket.IO packets are encoded with orjson"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode('utf-8')
+        except TypeError:
+            return json.dumps(obj, *args, **kwargs)
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'ultra-turbo-cleaner-secret-key-2025'
-socketio = SocketIO(app, cors_allowed_origins="*")
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600  # Let browsers cache static assets for an hour
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+socketio_options = {'json': OrjsonSocketIOCodec} if orjson is not None else {}
+socketio = SocketIO(app, async_mode=WebConfig.SOCKETIO_ASYNC_MODE, cors_allowed_origins="*",
+                    **socketio_options)
 
 # Setup basic logging
 logging.basicConfig(level=logging.INFO)
@@ -33,7 +85,8 @@ app_state = {
     'last_scan_results': None,
     'current_operation': None,
     'system_stats': None,
-    'dry_run_mode': os.environ.get('DRY_RUN', '0') == '1'
+    'dry_run_mode': os.environ.get('DRY_RUN', '0') == '1',
+    'settings_version': 0
 }
 
 # Try to import core modules (with fallbacks)
@@ -54,8 +107,8 @@ try:
     # Initialize API handlers
     system_api = SystemAPI()
     scanner_api = ScannerAPI(progress_tracker)
-    cleaner_api = CleanerAPI(cleaner_engine, progress_tracker)
-    websocket_handler = WebSocketHandler(socketio, progress_tracker)
+    cleaner_api = CleanerAPI(cleaner_engine, progress_tracker, system_api)
+    websocket_handler = WebSocketHandler(socketio, progress_tracker, system_api)
     
     logger.info("All modules loaded successfully")
     app_state['modules_loaded'] = True
@@ -79,6 +132,9 @@ except ImportError as e:
                 }
             }
         
+        def system_info_etag(self):
+            return None
+        
         def quick_scan(self, operation_id):
             return {
                 'operation_id': operation_id,
@@ -94,6 +150,61 @@ except ImportError as e:
     scanner_api = MockAPI()
     cleaner_api = MockAPI()
 
+# Worker threads hand Socket.IO events to one writer task instead of emitting
+# themselves, so a slow client never stalls a scan mid-emit
+emit_queue = queue.SimpleQueue()
+_emit_pump_lock = threading.Lock()
+_emit_pump_started = False
+
+def emit_pump():
+    """Forward queued (event, payload) pairs to Socket.IO clients"""
+    while True:
+        event, payload = emit_queue.get()
+        try:
+            socketio.emit(event, payload)
+        except Exception as e:
+            logger.error(f"Error emitting {event}: {e}")
+
+def queue_emit(event, payload):
+    """Queue an event for emit_pump, starting the pump on first use"""
+    global _emit_pump_started
+    if not _emit_pump_started:
+        with _emit_pump_lock:
+            if not _emit_pump_started:
+                socketio.start_background_task(emit_pump)
+                _emit_pump_started = True
+    emit_queue.put((event, payload))
+
+# Background scans share a small pool; requests beyond it are refused, not queued
+SCAN_WORKERS = 2
+SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix='scan')
+_scan_slots = threading.BoundedSemaphore(SCAN_WORKERS)
+
+# Operation IDs are unique per process even for requests within the same second
+_OP_COUNTER = itertools.count(1)
+
+# Settings shown by the settings page and served by /api/settings
+DEFAULT_WEB_SETTINGS = {
+    'scan_paths': ['%APPDATA%', '%LOCALAPPDATA%', '%TEMP%'],
+    'backup_enabled': True,
+    'safe_mode': True,
+    'max_file_age_days': 30,
+    'min_file_size_mb': 1
+}
+
+# Page templates rendered by the routes below
+PAGE_TEMPLATES = ['dashboard.html', 'cleaner.html', 'settings.html', 'logs.html']
+
+def warm_template_cache():
+    """Compile page templates once at startup instead of on first request"""
+    for template_name in PAGE_TEMPLATES:
+        try:
+            app.jinja_env.get_template(template_name)
+        except Exception as e:
+            logger.warning(f"Could not precompile template {template_name}: {e}")
+
+warm_template_cache()
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
@@ -122,14 +233,7 @@ def cleaner():
 def settings_page():
     """Settings management page"""
     try:
-        current_settings = {
-            'scan_paths': ['%APPDATA%', '%LOCALAPPDATA%', '%TEMP%'],
-            'backup_enabled': True,
-            'safe_mode': True,
-            'max_file_age_days': 30,
-            'min_file_size_mb': 1
-        }
-        return render_template('settings.html', settings=current_settings)
+        return render_template('settings.html', settings=DEFAULT_WEB_SETTINGS)
     except Exception as e:
         return f"<h1>Settings Page Error: {e}</h1>"
 
@@ -141,6 +245,25 @@ def logs():
     except Exception as e:
         return f"<h1>Logs Page Error: {e}</h1>"
 
+# Distinguishes validators issued by this process from those of earlier runs
+ETAG_EPOCH = int(time.time())
+
+def not_modified(etag):
+    """Header-only 304 response for a matching If-None-Match"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+def conditional_json(payload, etag=None):
+    """jsonify payload, or answer 304 without serializing when the client's copy is current"""
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        return not_modified(etag)
+    
+    response = jsonify(payload)
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    return response
+
 # API Routes
 @app.route('/api/health')
 def api_health():
@@ -157,7 +280,8 @@ def api_system_info():
     """Get system information"""
     try:
         info = system_api.get_system_info()
-        return jsonify(info)
+        etag = system_api.system_info_etag() if 'error' not in info else None
+        return conditional_json(info, etag)
     except Exception as e:
         logger.error(f"API error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -166,7 +290,7 @@ def api_system_info():
 def api_quick_scan():
     """Quick system scan"""
     try:
-        operation_id = f"quick_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        operation_id = f"quick_scan_{ETAG_EPOCH}_{next(_OP_COUNTER)}"
         
         if app_state['dry_run_mode']:
             # Simulate scan in dry run mode
@@ -174,17 +298,25 @@ def api_quick_scan():
             app_state['last_scan_results'] = results
             return jsonify(results)
         
-        # Start scan in background thread
+        if not _scan_slots.acquire(blocking=False):
+            return jsonify({'error': 'Too many scans in progress'}), 429
+        
+        # Run the scan on the shared pool
         def scan_thread():
             try:
                 results = scanner_api.quick_scan(operation_id)
                 app_state['last_scan_results'] = results
-                socketio.emit('scan_complete', results)
+                queue_emit('scan_complete', results)
             except Exception as e:
-                socketio.emit('scan_error', {'error': str(e)})
+                queue_emit('scan_error', {'error': str(e)})
+            finally:
+                _scan_slots.release()
         
-        thread = threading.Thread(target=scan_thread)
-        thread.start()
+        try:
+            SCAN_POOL.submit(scan_thread)
+        except Exception:
+            _scan_slots.release()
+            raise
         
         return jsonify({'operation_id': operation_id, 'status': 'started'})
     except Exception as e:
@@ -195,20 +327,15 @@ def api_quick_scan():
 def api_settings():
     """Get or update settings"""
     if request.method == 'GET':
-        current_settings = {
-            'scan_paths': ['%APPDATA%', '%LOCALAPPDATA%', '%TEMP%'],
-            'backup_enabled': True,
-            'safe_mode': True,
-            'max_file_age_days': 30,
-            'min_file_size_mb': 1
-        }
-        return jsonify(current_settings)
+        etag = f"settings-{ETAG_EPOCH}-{app_state['settings_version']}"
+        return conditional_json(DEFAULT_WEB_SETTINGS, etag)
     
     elif request.method == 'POST':
         try:
             data = request.get_json()
             # In a real implementation, save settings here
             logger.info(f"Settings update requested: {data}")
+            app_state['settings_version'] += 1
             return jsonify({'status': 'success', 'message': 'Settings updated'})
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -221,11 +348,16 @@ def handle_connect():
         'status': 'Connected to Ultra-Turbo AppData Cleaner',
         'dry_run_mode': app_state['dry_run_mode']
     })
+    if app_state['modules_loaded']:
+        websocket_handler.handle_client_connect(request.sid)
 
 @socketio.on('disconnect')
-def handle_disconnect():
+def handle_disconnect(*args):
     """Handle client disconnection"""
-    logger.info('Client disconnected')
+    if app_state['modules_loaded']:
+        websocket_handler.handle_client_disconnect(request.sid)
+    else:
+        logger.info('Client disconnected')
 
 @socketio.on('request_system_stats')
 def handle_system_stats_request():
@@ -236,6 +368,20 @@ def handle_system_stats_request():
     except Exception as e:
         emit('error', {'message': str(e)})
 
+@socketio.on('subscribe')
+def handle_subscribe(data):
+    """Join a targeted broadcast room such as the dashboard stats feed"""
+    room = data.get('room', '') if isinstance(data, dict) else ''
+    if app_state['modules_loaded'] and websocket_handler.subscribe(room):
+        emit('subscribed', {'room': room})
+
+@socketio.on('unsubscribe')
+def handle_unsubscribe(data):
+    """Leave a broadcast room"""
+    room = data.get('room', '') if isinstance(data, dict) else ''
+    if app_state['modules_loaded'] and room:
+        websocket_handler.unsubscribe(room)
+
 # Error handlers
 @app.errorhandler(404)
 def not_found_error(error):
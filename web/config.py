@@ -27,7 +27,9 @@ class WebConfig:
     PERMANENT_SESSION_LIFETIME = 3600  # 1 hour
     
     # WebSocket settings
-    SOCKETIO_ASYNC_MODE = 'threading'
+    # 'threading' (default) or 'eventlet'; eventlet serves many idle dashboards on one
+    # OS thread, but blocking scans then stall its hub, so it stays opt-in
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
     
     # Static files
     STATIC_FOLDER = 'static'
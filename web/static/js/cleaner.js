@@ -117,6 +117,7 @@ function startScan() {
         }
         
         currentScanOperation = data.operation_id;
+        subscribeOperation(data.operation_id);
         addActivityItem(`${scanType.charAt(0).toUpperCase() + scanType.slice(1)} Scan`, 'Scan started', 'info');
         
         console.log(`Scan started with operation ID: ${currentScanOperation}`);
@@ -503,6 +504,7 @@ function startCleaning() {
         }
         
         console.log('Cleaning started:', data.operation_id);
+        subscribeOperation(data.operation_id);
         addActivityItem('File Cleaning', 'Cleaning started', 'info');
     })
     .catch(error => {
@@ -5,6 +5,9 @@ let socket = null;
 let currentTheme = 'dark';
 let notificationCount = 0;
 
+// Socket.IO rooms this page listens to; joined again after every (re)connect
+const subscribedRooms = new Set();
+
 // Initialize main application
 function initializeApp() {
     console.log('🚀 Initializing Ultra-Turbo AppData Cleaner Web Interface');
@@ -88,6 +91,7 @@ function initializeWebSocket() {
     socket.on('connect', function() {
         console.log('✅ WebSocket connected');
         updateConnectionStatus(true);
+        subscribedRooms.forEach(room => socket.emit('subscribe', { room: room }));
     });
     
     socket.on('disconnect', function() {
@@ -116,6 +120,27 @@ function initializeWebSocket() {
     socket.on('error', handleError);
 }
 
+// Room subscriptions: system stats go to the dashboard room, progress to one room per operation
+function subscribeRoom(room) {
+    subscribedRooms.add(room);
+    if (socket && socket.connected) {
+        socket.emit('subscribe', { room: room });
+    }
+}
+
+function unsubscribeRoom(room) {
+    subscribedRooms.delete(room);
+    if (socket && socket.connected) {
+        socket.emit('unsubscribe', { room: room });
+    }
+}
+
+function subscribeOperation(operationId) {
+    if (operationId) {
+        subscribeRoom(`op:${operationId}`);
+    }
+}
+
 // Connection status management
 function updateConnectionStatus(connected) {
     const statusElement = document.getElementById('connection-status');
@@ -202,6 +227,7 @@ function hideProgressModal() {
 // Operation completion handlers
 function handleOperationCompleted(data) {
     console.log('✅ Operation completed:', data);
+    unsubscribeRoom(`op:${data.operation_id}`);
     
     showNotification(
         `${data.operation_name} completed successfully!`,
@@ -221,6 +247,7 @@ function handleOperationCompleted(data) {
 
 function handleOperationFailed(data) {
     console.log('❌ Operation failed:', data);
+    unsubscribeRoom(`op:${data.operation_id}`);
     
     showNotification(
         `${data.operation_name} failed: ${data.error}`,
@@ -481,6 +508,7 @@ function quickScan() {
                 throw new Error(data.error);
             }
             console.log('Quick scan started:', data.operation_id);
+            subscribeOperation(data.operation_id);
             addActivityItem('Quick Scan', 'Scan started', 'info');
         })
         .catch(error => {
@@ -503,6 +531,7 @@ function quickClean() {
                 throw new Error(data.error);
             }
             console.log('Quick clean started:', data.operation_id);
+            subscribeOperation(data.operation_id);
             addActivityItem('Quick Clean', 'Cleaning started', 'info');
         })
         .catch(error => {
@@ -2,8 +2,16 @@
 Additional utilities for web interface
 """
 
-from .hash_calculator import HashCalculator
+import os
+from functools import lru_cache
+
+from .hash_calculator import HashCalculator, HashCache
 from .size_calculator import SizeCalculator
 from .validators import Validators
 
-__all__ = ['HashCalculator', 'SizeCalculator', 'Validators']
\ No newline at end of file
+@lru_cache(maxsize=64)
+def expandvars(path: str) -> str:
+    """os.path.expandvars for the fixed location strings, expanded once per process"""
+    return os.path.expandvars(path)
+
+__all__ = ['HashCalculator', 'HashCache', 'SizeCalculator', 'Validators', 'expandvars']
\ No newline at end of file
@@ -2,54 +2,322 @@
 Hash calculation utilities for file operations
 """
 
+import filecmp
 import hashlib
+import mmap
+import os
+import stat
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# These digests identify file contents rather than protect secrets; saying so (Python 3.9+)
+# keeps MD5 available on FIPS-mode OpenSSL builds
+try:
+    hashlib.new('md5', usedforsecurity=False)
+    _HASH_OPTIONS = {'usedforsecurity': False}
+except TypeError:
+    _HASH_OPTIONS = {}
+
+def _new_hash(name: str):
+    """OpenSSL-backed (EVP) hash object, which uses SHA-NI where the CPU has it"""
+    return hashlib.new(name, **_HASH_OPTIONS)
+
+# Files at least this large are hashed from a memory map in a single update() call
+MMAP_HASH_THRESHOLD = 64 * 1024
+
+# Read size for files hashed with the read loop
+HASH_CHUNK_SIZE = 128 * 1024
+
+# Raw unbuffered reads; O_BINARY only exists (and matters) on Windows
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+def _update_from_file(hasher, file_path: Path, chunk_size: int) -> None:
+    """Feed a file into hasher, mapping large files instead of looping over reads"""
+    fd = os.open(file_path, _OPEN_FLAGS)
+    try:
+        mapped = None
+        if os.fstat(fd).st_size >= MMAP_HASH_THRESHOLD:
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # not mappable, fall back to reading
+        
+        if mapped is not None:
+            with mapped:
+                hasher.update(mapped)
+            return
+        
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        read = os.read
+        while chunk := read(fd, chunk_size):
+            hasher.update(chunk)
+    finally:
+        os.close(fd)
+
+def _file_digest(name: str, file_path: Path, chunk_size: int, cache: Optional['HashCache']) -> str:
+    """Hex digest of file_path, served from cache while its size and mtime are unchanged"""
+    if cache is None:
+        hasher = _new_hash(name)
+        _update_from_file(hasher, file_path, chunk_size)
+        return hasher.hexdigest()
+    
+    stat_result = file_path.stat()
+    digest = cache.get(file_path, name, stat_result)
+    if digest is None:
+        hasher = _new_hash(name)
+        _update_from_file(hasher, file_path, chunk_size)
+        digest = hasher.hexdigest()
+        cache.put(file_path, name, stat_result, digest)
+    return digest
+
+# Persistent digest cache, next to the settings and backups
+HASH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ultra_turbo_cleaner", "hashes.db")
+
+# Smaller files are rehashed instead of cached; a lookup would cost about as much
+HASH_CACHE_MIN_SIZE = 64 * 1024
+
+# Entry cap; once exceeded, the least recently used tenth of the cache is dropped
+HASH_CACHE_MAX_ENTRIES = 200_000
+HASH_CACHE_PRUNE_FRACTION = 0.1
+
+# The entry count is only checked every this many writes
+HASH_CACHE_PRUNE_INTERVAL = 1000
+
+class HashCache:
+    """SQLite-backed cache of file digests keyed by path and validated by size and mtime"""
+    
+    def __init__(self, db_path: Union[str, Path] = HASH_CACHE_PATH,
+                 min_cache_size: int = HASH_CACHE_MIN_SIZE,
+                 max_entries: int = HASH_CACHE_MAX_ENTRIES):
+        self.db_path = str(db_path)
+        self.min_cache_size = min_cache_size
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use; callers hold the lock"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, algo TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, digest TEXT NOT NULL, last_used REAL NOT NULL, "
+                "PRIMARY KEY (path, algo))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS hashes_last_used ON hashes (last_used)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+    
+    def get(self, file_path: Union[str, Path], algo: str, stat_result: os.stat_result) -> Optional[str]:
+        """Cached digest if the file still has the recorded size and mtime"""
+        if stat_result.st_size < self.min_cache_size:
+            return None
+        key = os.path.abspath(file_path)
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT size, mtime_ns, digest FROM hashes WHERE path = ? AND algo = ?",
+                    (key, algo)
+                ).fetchone()
+                if row is None or row[0] != stat_result.st_size or row[1] != stat_result.st_mtime_ns:
+                    return None
+                
+                conn.execute(
+                    "UPDATE hashes SET last_used = ? WHERE path = ? AND algo = ?",
+                    (time.time(), key, algo)
+                )
+                conn.commit()
+                return row[2]
+        except sqlite3.Error as e:
+            logger.warning(f"Hash cache lookup failed for {file_path}: {e}")
+            return None
+    
+    def put(self, file_path: Union[str, Path], algo: str, stat_result: os.stat_result, digest: str):
+        """Record digest for the file as it was when stat_result was taken"""
+        if stat_result.st_size < self.min_cache_size:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                    (os.path.abspath(file_path), algo, stat_result.st_size,
+                     stat_result.st_mtime_ns, digest, time.time())
+                )
+                self._writes += 1
+                if self._writes % HASH_CACHE_PRUNE_INTERVAL == 0:
+                    self._prune(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Hash cache update failed for {file_path}: {e}")
+    
+    def _prune(self, conn: sqlite3.Connection):
+        """Drop least recently used entries once the cache is over max_entries"""
+        count = conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+        if count > self.max_entries:
+            excess = count - self.max_entries + int(self.max_entries * HASH_CACHE_PRUNE_FRACTION)
+            conn.execute(
+                "DELETE FROM hashes WHERE rowid IN "
+                "(SELECT rowid FROM hashes ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+def _inode_key(file_path: Union[str, Path]) -> int:
+    """Inode (file index on NTFS) used to order batched reads; 0 if the file cannot be stat'ed"""
+    try:
+        return os.stat(file_path).st_ino
+    except OSError:
+        return 0
+
+# OpenSSL releases the GIL while hashing, so threads spread the work across cores
+MAX_HASH_WORKERS = 32
+
 class HashCalculator:
     """Utility class for file hash calculations"""
     
     @staticmethod
-    def calculate_md5(file_path: Union[str, Path], chunk_size: int = 8192) -> Optional[str]:
+    def calculate_md5(file_path: Union[str, Path], chunk_size: int = HASH_CHUNK_SIZE,
+                      cache: Optional[HashCache] = None) -> Optional[str]:
         """Calculate MD5 hash of a file"""
         try:
             file_path = Path(file_path)
             if not file_path.exists() or not file_path.is_file():
                 return None
             
-            hash_md5 = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    hash_md5.update(chunk)
-            
-            return hash_md5.hexdigest()
+            return _file_digest('md5', file_path, chunk_size, cache)
             
         except Exception as e:
             logger.error(f"Error calculating MD5 for {file_path}: {e}")
             return None
     
     @staticmethod
-    def calculate_sha256(file_path: Union[str, Path], chunk_size: int = 8192) -> Optional[str]:
+    def calculate_sha256(file_path: Union[str, Path], chunk_size: int = HASH_CHUNK_SIZE,
+                      cache: Optional[HashCache] = None) -> Optional[str]:
         """Calculate SHA256 hash of a file"""
         try:
             file_path = Path(file_path)
             if not file_path.exists() or not file_path.is_file():
                 return None
             
-            hash_sha256 = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    hash_sha256.update(chunk)
-            
-            return hash_sha256.hexdigest()
+            return _file_digest('sha256', file_path, chunk_size, cache)
             
         except Exception as e:
             logger.error(f"Error calculating SHA256 for {file_path}: {e}")
             return None
     
+    @staticmethod
+    def calculate_many(file_paths: Iterable[Union[str, Path]], algo: str = 'sha256',
+                       workers: Optional[int] = None,
+                       cache: Optional[HashCache] = None) -> Dict[Union[str, Path], Optional[str]]:
+        """Hash many files concurrently; results are keyed by path in input order"""
+        calculators = {
+            'md5': HashCalculator.calculate_md5,
+            'sha256': HashCalculator.calculate_sha256
+        }
+        if algo not in calculators:
+            raise ValueError(f"Unsupported hash algorithm: {algo}")
+        
+        file_paths = list(file_paths)
+        if not file_paths:
+            return {}
+        
+        if workers is None:
+            workers = min(MAX_HASH_WORKERS, (os.cpu_count() or 1) * 4)
+        
+        # Submit in inode order, which roughly follows the on-disk layout, so the
+        # in-flight reads stay close together; results keep the caller's order
+        results = dict.fromkeys(file_paths)
+        submit_order = sorted(results, key=_inode_key)
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(submit_order))) as executor:
+            calculate = partial(calculators[algo], cache=cache)
+            results.update(zip(submit_order, executor.map(calculate, submit_order)))
+        
+        return results
+    
+    @staticmethod
+    def find_duplicates(file_paths: Iterable[Union[str, Path]], cache: Optional[HashCache] = None,
+                        verify: bool = True) -> Dict[str, List[Path]]:
+        """Group identical files by SHA256, fully hashing only files whose size and quick hash collide
+        
+        Each member is then confirmed byte for byte against the first, since the result
+        drives deletion; verify=False skips that second read when a digest match is enough.
+        """
+        # Most files have a unique size and never need to be read
+        size_groups = defaultdict(list)
+        for file_path in file_paths:
+            file_path = Path(file_path)
+            try:
+                stat_result = file_path.stat()
+            except OSError as e:
+                logger.debug(f"Error getting size for {file_path}: {e}")
+                continue
+            if stat.S_ISREG(stat_result.st_mode):
+                size_groups[stat_result.st_size].append(file_path)
+        
+        # Within a size, the head/tail sample separates most of the rest
+        candidates = []
+        for files in size_groups.values():
+            if len(files) < 2:
+                continue
+            quick_groups = defaultdict(list)
+            for file_path in files:
+                quick = HashCalculator.quick_hash(file_path)
+                if quick is not None:
+                    quick_groups[quick].append(file_path)
+            for group in quick_groups.values():
+                if len(group) > 1:
+                    candidates.extend(group)
+        
+        hash_groups = defaultdict(list)
+        for file_path, digest in HashCalculator.calculate_many(candidates, 'sha256', cache=cache).items():
+            if digest is not None:
+                hash_groups[digest].append(file_path)
+        
+        duplicates = {}
+        for digest, files in hash_groups.items():
+            if len(files) > 1 and verify:
+                original = files[0]
+                files = [original] + [f for f in files[1:] if HashCalculator._same_content(original, f)]
+            if len(files) > 1:
+                duplicates[digest] = files
+        
+        return duplicates
+    
+    @staticmethod
+    def _same_content(first: Path, second: Path) -> bool:
+        """Byte-for-byte comparison confirming a digest match"""
+        try:
+            return filecmp.cmp(first, second, shallow=False)
+        except OSError as e:
+            logger.debug(f"Error comparing {first} and {second}: {e}")
+            return False
+    
     @staticmethod
     def quick_hash(file_path: Union[str, Path], sample_size: int = 1024) -> Optional[str]:
         """Calculate quick hash using first and last bytes + file size"""
@@ -64,7 +332,7 @@ class HashCalculator:
             if file_size <= sample_size * 2:
                 return HashCalculator.calculate_md5(file_path)
             
-            hash_md5 = hashlib.md5()
+            hash_md5 = _new_hash('md5')
             
             with open(file_path, 'rb') as f:
                 # Read first sample_size bytes
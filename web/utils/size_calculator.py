@@ -2,12 +2,83 @@
 Size calculation utilities
 """
 
+import heapq
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Union, Dict, List
+from typing import Union, Dict, Iterator, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _iter_file_sizes(root: str) -> Iterator[Tuple[int, str]]:
+    """(size, path) for every regular file under root, without following links"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry.stat(follow_symlinks=False).st_size, entry.path
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Threads for sizing top-level subdirectories; the walk is bound by stat latency, not CPU
+DIRECTORY_SCAN_WORKERS = 8
+
+def _scan_level(path: str) -> Tuple[int, int, List[str]]:
+    """Size and count of the files directly in path, plus its subdirectories"""
+    total_size = 0
+    file_count = 0
+    subdirs = []
+    
+    # DirEntry answers is_file/is_dir from the directory listing
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    
+    return total_size, file_count, subdirs
+
+def _directory_totals(path: str, depth: int, max_depth: Optional[int]) -> Tuple[int, int, int]:
+    """Total size, file count and directory count of the tree under path"""
+    total_size = 0
+    file_count = 0
+    directory_count = 0
+    
+    stack = [(path, depth)]
+    while stack:
+        path, depth = stack.pop()
+        if max_depth and depth > max_depth:
+            continue
+        
+        size, files, subdirs = _scan_level(path)
+        total_size += size
+        file_count += files
+        directory_count += len(subdirs)
+        stack.extend((subdir, depth + 1) for subdir in subdirs)
+    
+    return total_size, file_count, directory_count
+
 class SizeCalculator:
     """Utility class for size calculations"""
     
@@ -24,42 +95,37 @@ class SizeCalculator:
             return 0
     
     @staticmethod
-    def get_directory_size(dir_path: Union[str, Path], max_depth: int = None) -> Dict[str, int]:
-        """Get directory size with breakdown"""
+    def get_directory_size(dir_path: Union[str, Path], max_depth: int = None,
+                           max_workers: int = DIRECTORY_SCAN_WORKERS) -> Dict[str, int]:
+        """Get directory size with breakdown
+        
+        Top-level subdirectories are walked on max_workers threads; pass 1 for spinning disks.
+        """
         try:
             dir_path = Path(dir_path)
             if not dir_path.exists() or not dir_path.is_dir():
                 return {'total_size': 0, 'file_count': 0, 'error': 'Directory does not exist'}
             
-            total_size = 0
-            file_count = 0
-            current_depth = 0
-            
-            def scan_directory(path: Path, depth: int) -> None:
-                nonlocal total_size, file_count
-                
-                if max_depth and depth > max_depth:
-                    return
+            root = os.fspath(dir_path)
+            if max_workers <= 1:
+                total_size, file_count, directory_count = _directory_totals(root, 0, max_depth)
+            else:
+                total_size, file_count, subdirs = _scan_level(root)
+                directory_count = len(subdirs)
                 
-                try:
-                    for item in path.iterdir():
-                        try:
-                            if item.is_file():
-                                total_size += item.stat().st_size
-                                file_count += 1
-                            elif item.is_dir():
-                                scan_directory(item, depth + 1)
-                        except (PermissionError, OSError):
-                            continue
-                except (PermissionError, OSError):
-                    pass
-            
-            scan_directory(dir_path, 0)
+                # Workers return their own totals, which are summed here
+                if subdirs:
+                    walk = partial(_directory_totals, depth=1, max_depth=max_depth)
+                    with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+                        for size, files, directories in executor.map(walk, subdirs):
+                            total_size += size
+                            file_count += files
+                            directory_count += directories
             
             return {
                 'total_size': total_size,
                 'file_count': file_count,
-                'directory_count': len([d for d in dir_path.rglob('*') if d.is_dir()]) if max_depth is None else -1
+                'directory_count': directory_count
             }
             
         except Exception as e:
@@ -71,16 +137,15 @@ class SizeCalculator:
         """Format size in human-readable format"""
         if size_bytes == 0:
             return "0 B"
+        if size_bytes < 1024:
+            return f"{float(size_bytes):.1f} B"
+        if not math.isfinite(size_bytes):
+            # Same output as the old division loop: nan stayed in B, inf climbed to PB
+            return f"{size_bytes:.1f} {_SIZE_UNITS[0] if math.isnan(size_bytes) else _SIZE_UNITS[-1]}"
         
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024.0 and unit_index < len(units) - 1:
-            size /= 1024.0
-            unit_index += 1
-        
-        return f"{size:.1f} {units[unit_index]}"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
     
     @staticmethod
     def calculate_sizes_for_files(file_paths: List[Union[str, Path]]) -> Dict:
@@ -113,24 +178,19 @@ class SizeCalculator:
             if not dir_path.exists():
                 return []
             
-            files_with_sizes = []
-            
-            for file_path in dir_path.rglob('*'):
-                if file_path.is_file():
-                    try:
-                        size = file_path.stat().st_size
-                        files_with_sizes.append({
-                            'path': str(file_path),
-                            'name': file_path.name,
-                            'size': size,
-                            'size_formatted': SizeCalculator.format_size(size)
-                        })
-                    except (PermissionError, OSError):
-                        continue
+            # The walk streams into the heap, so only the top N (size, path) pairs are held
+            format_size = SizeCalculator.format_size
+            top = heapq.nlargest(count, _iter_file_sizes(os.fspath(dir_path)), key=itemgetter(0))
             
-            # Sort by size (descending) and return top N
-            files_with_sizes.sort(key=lambda x: x['size'], reverse=True)
-            return files_with_sizes[:count]
+            return [
+                {
+                    'path': path,
+                    'name': os.path.basename(path),
+                    'size': size,
+                    'size_formatted': format_size(size)
+                }
+                for size, path in top
+            ]
             
         except Exception as e:
             logger.error(f"Error finding largest files in {dir_path}: {e}")
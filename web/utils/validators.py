@@ -2,14 +2,133 @@
 Validation utilities for web interface
 """
 
+import fnmatch
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Union, Optional
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# CreateFileW with no sharing fails with ERROR_SHARING_VIOLATION while another process has the file open
+_create_file = None
+if os.name == 'nt':
+    try:
+        import ctypes
+        from ctypes import wintypes
+        _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        _create_file = _kernel32.CreateFileW
+        _create_file.argtypes = (wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                 wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE)
+        _create_file.restype = wintypes.HANDLE
+        _close_handle = _kernel32.CloseHandle
+        _close_handle.argtypes = (wintypes.HANDLE,)
+        _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    except (ImportError, AttributeError, OSError):
+        _create_file = None
+
+_GENERIC_READ = 0x80000000
+_OPEN_EXISTING = 3
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_PATH_NOT_FOUND = 3
+
+# Lookup tables and patterns, built once instead of on every call
+_INVALID_PATH_CHARS = frozenset('<>"|?*')
+_INVALID_PATTERN_CHARS = frozenset('<>"|')
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+_SANITIZE_RE = re.compile(r'[<>:"/\|?*]')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def _keyword_re(keywords: List[str]) -> re.Pattern:
+    """One alternation matching any of keywords, so a path is scanned once instead of once per keyword"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# Critical system directories - NEVER delete
+_CRITICAL_PATHS_RE = _keyword_re([
+    'c:\\windows\\system32',
+    'c:\\windows\\syswow64',
+    'c:\\program files',
+    'c:\\program files (x86)',
+    '\\windows\\',
+    '\\system32\\',
+    '\\syswow64\\'
+])
+
+# Protected file types, deletable only inside temp-like directories
+_DANGEROUS_EXTENSIONS = frozenset({'.exe', '.dll', '.sys', '.ini', '.cfg', '.reg'})
+_TEMP_INDICATORS_RE = _keyword_re(['temp', 'tmp', 'cache'])
+
+_USER_IMPORTANT_RE = _keyword_re([
+    '\\documents\\',
+    '\\desktop\\',
+    '\\downloads\\',
+    '\\pictures\\',
+    '\\music\\',
+    '\\videos\\'
+])
+
+# Scan roots that are accepted with a warning
+_DANGEROUS_SCAN_RE = _keyword_re(['system32', 'program files'])
+
+@lru_cache(maxsize=65536)
+def _path_risk(path_str: str, extension: str) -> Optional[str]:
+    """Reason a lowercased path must not be deleted, or None; depends only on the path, so it is cached"""
+    # Critical system directories - NEVER delete
+    if _CRITICAL_PATHS_RE.search(path_str):
+        return 'Critical system directory'
+    
+    # Protected file types
+    if extension in _DANGEROUS_EXTENSIONS:
+        # Allow deletion in temp directories
+        if not _TEMP_INDICATORS_RE.search(path_str):
+            return 'System file type'
+    
+    # User important directories
+    if _USER_IMPORTANT_RE.search(path_str):
+        return 'Important user directory'
+    
+    return None
+
+def _is_locked(file_path: Path, check_locks: bool = False) -> bool:
+    """Whether another process holds the file open (Windows) or locked (POSIX, only with check_locks)"""
+    if _create_file is not None:
+        handle = _create_file(os.fspath(file_path), _GENERIC_READ, 0, None, _OPEN_EXISTING, 0, None)
+        if handle == _INVALID_HANDLE_VALUE:
+            # Sharing violations and anything else unexpected count as in use
+            return ctypes.get_last_error() not in (_ERROR_FILE_NOT_FOUND, _ERROR_PATH_NOT_FOUND)
+        _close_handle(handle)
+        return False
+    
+    # POSIX has no mandatory locks, so unlinking an open file is fine; advisory locks are opt-in
+    if not check_locks or fcntl is None:
+        return False
+    
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return False
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
+
 class Validators:
     """Utility class for various validations"""
     
@@ -22,20 +141,12 @@ class Validators:
                 return False
             
             # Check for invalid characters
-            invalid_chars = ['<', '>', '"', '|', '?', '*']
-            if any(char in path for char in invalid_chars):
+            if not _INVALID_PATH_CHARS.isdisjoint(path):
                 return False
             
             # Check for reserved names (Windows)
-            reserved_names = [
-                'CON', 'PRN', 'AUX', 'NUL',
-                'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-            ]
-            
-            path_parts = Path(path).parts
-            for part in path_parts:
-                if part.upper() in reserved_names:
+            for part in Path(path).parts:
+                if part.upper() in _RESERVED_NAMES:
                     return False
             
             return True
@@ -54,47 +165,12 @@ class Validators:
             if not file_path.exists():
                 return {'safe': False, 'reason': 'File does not exist'}
             
-            path_str = str(file_path).lower()
-            
-            # Critical system directories - NEVER delete
-            critical_paths = [
-                'c:\\windows\\system32',
-                'c:\\windows\\syswow64', 
-                'c:\\program files',
-                'c:\\program files (x86)',
-                '\\windows\\',
-                '\\system32\\',
-                '\\syswow64\\'
-            ]
-            
-            for critical_path in critical_paths:
-                if critical_path in path_str:
-                    return {'safe': False, 'reason': 'Critical system directory'}
-            
-            # Protected file types
-            dangerous_extensions = ['.exe', '.dll', '.sys', '.ini', '.cfg', '.reg']
-            if file_path.suffix.lower() in dangerous_extensions:
-                # Allow deletion in temp directories
-                temp_indicators = ['temp', 'tmp', 'cache']
-                if not any(temp in path_str for temp in temp_indicators):
-                    return {'safe': False, 'reason': 'System file type'}
-            
-            # User important directories
-            user_important = [
-                '\\documents\\',
-                '\\desktop\\',
-                '\\downloads\\',
-                '\\pictures\\',
-                '\\music\\',
-                '\\videos\\'
-            ]
-            
-            for important_path in user_important:
-                if important_path in path_str:
-                    return {'safe': False, 'reason': 'Important user directory'}
+            reason = _path_risk(str(file_path).lower(), file_path.suffix.lower())
+            if reason is not None:
+                return {'safe': False, 'reason': reason}
             
-            # Check if file is in use
-            if Validators.is_file_in_use(file_path):
+            # Check if file is in use; never cached, since that changes from call to call
+            if _is_locked(file_path):
                 return {'safe': False, 'reason': 'File is currently in use'}
             
             return {'safe': True, 'reason': 'File appears safe to delete'}
@@ -104,20 +180,15 @@ class Validators:
             return {'safe': False, 'reason': f'Error during safety check: {str(e)}'}
     
     @staticmethod
-    def is_file_in_use(file_path: Union[str, Path]) -> bool:
+    def is_file_in_use(file_path: Union[str, Path], check_locks: bool = False) -> bool:
         """Check if file is currently in use"""
         try:
             file_path = Path(file_path)
             if not file_path.exists():
                 return False
             
-            # Try to open file in exclusive mode
-            with open(file_path, 'r+b'):
-                pass
-            return False
+            return _is_locked(file_path, check_locks)
             
-        except (PermissionError, OSError):
-            return True
         except Exception:
             return True
     
@@ -141,25 +212,24 @@ class Validators:
                 invalid_paths.append(path_str)
                 continue
             
-            path = Path(expanded_path)
+            path = str(Path(expanded_path))
             
-            # Check if path exists
-            if not path.exists():
+            # Check existence and accessibility by opening the listing; one entry is enough
+            try:
+                with os.scandir(path) as entries:
+                    next(entries, None)
+            except FileNotFoundError:
                 invalid_paths.append(path_str)
                 continue
-            
-            # Check if path is accessible
-            try:
-                list(path.iterdir())
-            except (PermissionError, OSError):
+            except NotADirectoryError:
+                (warning_paths if os.path.exists(path) else invalid_paths).append(path_str)
+                continue
+            except OSError:
                 warning_paths.append(path_str)
                 continue
             
             # Check for potentially dangerous paths
-            path_lower = str(path).lower()
-            dangerous_indicators = ['system32', 'program files']
-            
-            if any(indicator in path_lower for indicator in dangerous_indicators):
+            if _DANGEROUS_SCAN_RE.search(path.lower()):
                 warning_paths.append(path_str)
             else:
                 valid_paths.append(path_str)
@@ -214,8 +284,7 @@ class Validators:
     @staticmethod
     def is_valid_email(email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def is_valid_file_pattern(pattern: str) -> bool:
@@ -226,14 +295,17 @@ class Validators:
                 return False
             
             # Check for invalid characters that could be dangerous
-            invalid_chars = ['<', '>', '"', '|']
-            if any(char in pattern for char in invalid_chars):
+            if not _INVALID_PATTERN_CHARS.isdisjoint(pattern):
                 return False
             
-            # Test if it's a valid glob pattern by trying to use it
-            test_path = Path('.')
-            list(test_path.glob(pattern))  # This will raise an error if pattern is invalid
+            # Syntactic checks only; globbing the working directory could walk the whole tree
+            pattern_path = Path(pattern)
+            if pattern_path.anchor:
+                return False  # Path.glob only takes relative patterns
+            if any('**' in part and part != '**' for part in pattern_path.parts):
+                return False  # '**' must be an entire path component
             
+            re.compile(fnmatch.translate(pattern))
             return True
             
         except Exception:
@@ -243,10 +315,10 @@ class Validators:
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename for safe usage"""
         # Remove or replace invalid characters
-        filename = re.sub(r'[<>:"/\|?*]', '_', filename)
+        filename = _SANITIZE_RE.sub('_', filename)
         
         # Remove control characters
-        filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
+        filename = _CONTROL_CHARS_RE.sub('', filename)
         
         # Limit length
         if len(filename) > 255:
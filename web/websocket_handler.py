@@ -2,69 +2,155 @@
 WebSocket handler for real-time communication
 """
 
-from flask_socketio import emit
+from flask_socketio import emit, join_room, leave_room
 import logging
-from datetime import datetime
+import threading
+from typing import Dict, Optional
 from core.progress import ProgressInfo
+from utils.formatters import now_iso
 
 logger = logging.getLogger(__name__)
 
+# Progress ticks are coalesced to one emit per operation per interval (seconds)
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Statuses that are emitted immediately rather than coalesced
+_FINAL_STATUSES = frozenset({'completed', 'failed'})
+
+# The system info snapshot served to connecting clients is refreshed this often (seconds)
+SYSTEM_INFO_MAX_AGE = 2.0
+
+# Room for clients that want system stats broadcasts; each client is also in a room named by its sid
+DASHBOARD_ROOM = 'dashboard'
+SUBSCRIBABLE_ROOMS = frozenset({DASHBOARD_ROOM})
+
+# Progress ticks go only to clients that joined the operation's room
+OPERATION_ROOM_PREFIX = 'op:'
+
+def operation_room(operation_id: str) -> str:
+    """Room receiving progress_update events for one operation"""
+    return f"{OPERATION_ROOM_PREFIX}{operation_id}"
+
 class WebSocketHandler:
     """Handle WebSocket communication for real-time updates"""
     
-    def __init__(self, socketio, progress_tracker):
+    def __init__(self, socketio, progress_tracker, system_api=None):
         self.socketio = socketio
         self.progress_tracker = progress_tracker
-        self.connected_clients = set()
+        self.system_api = system_api
+        
+        # Socket.IO tracks the sessions themselves; only the count is kept here
+        self._client_count = 0
+        self._clients_lock = threading.Lock()
+        
+        # System info snapshot served to connecting clients; the lock makes fetches single-flight
+        self._system_info: Optional[dict] = None
+        self._system_info_lock = threading.RLock()
+        self._system_info_loop_running = False
+        
+        # Latest progress per operation, drained by a background task while updates arrive
+        self._pending: Dict[str, ProgressInfo] = {}
+        self._pending_lock = threading.Lock()
+        self._flushing = False
+        
+        # Serializes progress emits so a flush can't land after an operation's final event
+        self._emit_lock = threading.Lock()
         
         # Register progress callback
         self.progress_tracker.add_callback(self._on_progress_update)
+        
+        # Warm the snapshot before the first (re)connecting clients ask for it
+        self._start_system_info_loop()
     
     def _on_progress_update(self, progress_info: ProgressInfo):
-        """Handle progress updates and broadcast to clients"""
+        """Handle progress updates; only the latest tick per operation is broadcast each interval"""
+        if progress_info.status.value in _FINAL_STATUSES:
+            with self._emit_lock:
+                with self._pending_lock:
+                    self._pending.pop(progress_info.operation_id, None)
+                self._emit_progress(progress_info)
+            return
+        
+        with self._pending_lock:
+            self._pending[progress_info.operation_id] = progress_info
+            if self._flushing:
+                return
+            self._flushing = True
+        
+        self.socketio.start_background_task(self._flush_pending)
+    
+    def _flush_pending(self):
+        """Broadcast pending progress once per interval, exiting when no updates are left"""
+        while True:
+            self.socketio.sleep(PROGRESS_EMIT_INTERVAL)
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                if not pending:
+                    self._flushing = False
+                    return
+            
+            timestamp = now_iso()
+            with self._emit_lock:
+                for progress_info in pending.values():
+                    self._emit_progress(progress_info, timestamp, skip_final=True)
+    
+    def _emit_progress(self, progress_info: ProgressInfo, timestamp: Optional[str] = None,
+                       skip_final: bool = False):
+        """Broadcast progress to clients; a flush passes one timestamp for all its operations
+        
+        The tracker hands out live ProgressInfo objects, so a flush may find an operation
+        already finished; with skip_final it leaves that to the final-status callback.
+        """
         try:
+            operation_id = progress_info.operation_id
+            operation_name = progress_info.operation_name
+            status = progress_info.status.value
+            if skip_final and status in _FINAL_STATUSES:
+                return
+            status_message = progress_info.status_message
+            elapsed_time = progress_info.elapsed_time
+            
             progress_data = {
-                'operation_id': progress_info.operation_id,
-                'operation_name': progress_info.operation_name,
-                'status': progress_info.status.value,
+                'operation_id': operation_id,
+                'operation_name': operation_name,
+                'status': status,
                 'percentage': progress_info.percentage,
                 'current': progress_info.current,
                 'total': progress_info.total,
                 'current_item': progress_info.current_item,
-                'status_message': progress_info.status_message,
+                'status_message': status_message,
                 'items_processed': progress_info.items_processed,
                 'items_failed': progress_info.items_failed,
-                'elapsed_seconds': progress_info.elapsed_time.total_seconds() if progress_info.elapsed_time else 0,
-                'timestamp': datetime.now().isoformat()
+                'elapsed_seconds': elapsed_time.total_seconds() if elapsed_time else 0,
+                'timestamp': timestamp or now_iso()
             }
             
-            # Broadcast to all connected clients
-            self.socketio.emit('progress_update', progress_data)
+            self.socketio.emit('progress_update', progress_data, to=operation_room(operation_id))
             
-            # Send specific events based on status
-            if progress_info.status.value == 'completed':
+            # Final events go to every client so other pages still hear about the outcome
+            if status == 'completed':
                 self.socketio.emit('operation_completed', {
-                    'operation_id': progress_info.operation_id,
-                    'operation_name': progress_info.operation_name,
-                    'final_message': progress_info.status_message
+                    'operation_id': operation_id,
+                    'operation_name': operation_name,
+                    'final_message': status_message
                 })
-            elif progress_info.status.value == 'failed':
+            elif status == 'failed':
                 self.socketio.emit('operation_failed', {
-                    'operation_id': progress_info.operation_id,
-                    'operation_name': progress_info.operation_name,
+                    'operation_id': operation_id,
+                    'operation_name': operation_name,
                     'error': progress_info.last_error
                 })
             
         except Exception as e:
             logger.error(f"Error broadcasting progress update: {e}")
     
-    def broadcast_system_stats(self, stats: dict):
-        """Broadcast system statistics to all clients"""
+    def broadcast_system_stats(self, stats: dict, room: Optional[str] = None):
+        """Broadcast system statistics to all clients, or only to those in room (e.g. DASHBOARD_ROOM)"""
         try:
             self.socketio.emit('system_stats_update', {
                 'stats': stats,
-                'timestamp': datetime.now().isoformat()
-            })
+                'timestamp': now_iso()
+            }, to=room)
         except Exception as e:
             logger.error(f"Error broadcasting system stats: {e}")
     
@@ -73,7 +159,7 @@ class WebSocketHandler:
         try:
             self.socketio.emit('scan_results', {
                 'results': scan_results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
         except Exception as e:
             logger.error(f"Error broadcasting scan results: {e}")
@@ -83,7 +169,7 @@ class WebSocketHandler:
         try:
             self.socketio.emit('cleaning_results', {
                 'results': cleaning_results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
         except Exception as e:
             logger.error(f"Error broadcasting cleaning results: {e}")
@@ -94,7 +180,7 @@ class WebSocketHandler:
             self.socketio.emit('notification', {
                 'message': message,
                 'type': notification_type,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
@@ -105,30 +191,86 @@ class WebSocketHandler:
             self.socketio.emit('error', {
                 'message': error_message,
                 'operation_id': operation_id,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
         except Exception as e:
             logger.error(f"Error sending error message: {e}")
     
     def handle_client_connect(self, client_id: str):
         """Handle new client connection"""
-        self.connected_clients.add(client_id)
+        with self._clients_lock:
+            self._client_count += 1
         logger.info(f"Client connected: {client_id}")
+        self._start_system_info_loop()
         
-        # Send current system status to new client
+        # Send current system status to the new client only
         try:
-            from web.api.system import SystemAPI
-            system_api = SystemAPI()
-            system_info = system_api.get_system_info()
-            self.socketio.emit('initial_system_info', system_info)
+            self.socketio.emit('initial_system_info', self._system_info_snapshot(), to=client_id)
         except Exception as e:
             logger.error(f"Error sending initial system info: {e}")
     
+    def _system_info_snapshot(self) -> dict:
+        """Latest system info; without one yet, a single caller fetches it while the rest wait"""
+        snapshot = self._system_info
+        if snapshot is not None:
+            return snapshot
+        
+        with self._system_info_lock:
+            if self._system_info is None:
+                return self._refresh_system_info()
+            return self._system_info
+    
+    def _refresh_system_info(self) -> dict:
+        """Fetch system info and store it as the current snapshot"""
+        with self._system_info_lock:
+            if self.system_api is None:
+                from web.api.system import SystemAPI
+                self.system_api = SystemAPI()
+            self._system_info = self.system_api.get_system_info()
+            return self._system_info
+    
+    def _start_system_info_loop(self):
+        """Start the refresh loop unless it is already running"""
+        with self._clients_lock:
+            if self._system_info_loop_running:
+                return
+            self._system_info_loop_running = True
+        self.socketio.start_background_task(self._system_info_loop)
+    
+    def _system_info_loop(self):
+        """Refresh the snapshot every SYSTEM_INFO_MAX_AGE seconds and push it to the dashboard room
+        
+        Stops once no clients are left.
+        """
+        while True:
+            try:
+                self.broadcast_system_stats(self._refresh_system_info(), room=DASHBOARD_ROOM)
+            except Exception as e:
+                logger.error(f"Error refreshing system info: {e}")
+            
+            self.socketio.sleep(SYSTEM_INFO_MAX_AGE)
+            with self._clients_lock:
+                if not self._client_count:
+                    self._system_info_loop_running = False
+                    return
+    
     def handle_client_disconnect(self, client_id: str):
         """Handle client disconnection"""
-        self.connected_clients.discard(client_id)
+        with self._clients_lock:
+            self._client_count = max(0, self._client_count - 1)
         logger.info(f"Client disconnected: {client_id}")
     
+    def subscribe(self, room: str) -> bool:
+        """Add the calling client to a broadcast room; must run inside a Socket.IO event handler"""
+        if not isinstance(room, str) or not (room in SUBSCRIBABLE_ROOMS or room.startswith(OPERATION_ROOM_PREFIX)):
+            return False
+        join_room(room)
+        return True
+    
+    def unsubscribe(self, room: str):
+        """Remove the calling client from a broadcast room"""
+        leave_room(room)
+    
     def get_connected_clients_count(self) -> int:
         """Get number of connected clients"""
-        return len(self.connected_clients)
\ No newline at end of file
+        return self._client_count
\ No newline at end of file